@@ -0,0 +1,183 @@
+"""On-disk cache of validated configurations, keyed on the files they were built from."""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import os
+import pickle
+import struct
+import time
+from pathlib import Path
+from typing import Iterable
+
+from . import __version__, _json
+from .config_models import (
+    AgentSettings,
+    MCPHttpConfig,
+    MCPStdioConfig,
+    OpenAISettings,
+    SubAgentConfig,
+)
+from .skills import AgentSkill, AgentSkillAttachment
+
+_NOCACHE_ENV = "CODEX_SUB_AGENT_CONFIG_NOCACHE"
+_CACHE_FORMAT = 8
+# Entries start with the length of a JSON header, which is checked before the pickled
+# configuration that follows it is loaded.
+_HEADER_LENGTH = struct.Struct(">I")
+# Files touched this recently may change again without a visible mtime bump, so they
+# are not trusted for caching (the same "racy timestamp" rule git applies to its index).
+_RACY_WINDOW_NS = 2_000_000_000
+
+Fingerprint = tuple[tuple[str, int, int], ...]
+
+# Configurations already loaded by this process, so repeat loads skip unpickling too.
+_loaded: dict[str, tuple[Fingerprint, SubAgentConfig]] = {}
+
+
+@functools.cache
+def _cache_build() -> dict[str, int | str]:
+    """Identify the package release and model layout that a cache entry was written by.
+
+    This is stored in the entry's JSON header, so entries from another release or schema
+    are rejected without unpickling anything.
+    """
+
+    parts: list[str] = []
+    for model in (OpenAISettings, AgentSettings, MCPStdioConfig, MCPHttpConfig, SubAgentConfig):
+        parts.extend(f"{model.__qualname__}.{name}:{info.annotation!r}" for name, info in model.model_fields.items())
+    for cls in (AgentSkill, AgentSkillAttachment):
+        parts.extend(f"{cls.__qualname__}.{item.name}:{item.type}" for item in dataclasses.fields(cls))
+    digest = hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+    return {"format": _CACHE_FORMAT, "version": __version__, "schema": digest}
+
+
+def _cache_file(config_path: Path) -> Path | None:
+    if os.environ.get(_NOCACHE_ENV) == "1":
+        return None
+    key = hashlib.blake2b(str(config_path.absolute()).encode(), digest_size=16).hexdigest()
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_root / "codex-sub-agent" / f"config-{key}.pkl"
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Return whether a cache file is owned by this user and writable by nobody else.
+
+    Unpickling runs arbitrary code, so entries another account could have planted are ignored.
+    """
+
+    if st.st_mode & 0o022:
+        return False
+    getuid = getattr(os, "getuid", None)
+    return getuid is None or st.st_uid == getuid()
+
+
+def _fingerprint(paths: Iterable[str]) -> Fingerprint:
+    entries: list[tuple[str, int, int]] = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            # Record absence so that creating the file later invalidates the cache.
+            entries.append((path, -1, -1))
+        else:
+            entries.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(entries)
+
+
+def _expand_dependencies(config_path: Path, agent_dirs: Iterable[Path]) -> list[str]:
+    paths = [str(config_path.absolute())]
+    for agent_dir in agent_dirs:
+        # Directory mtimes catch added or removed skills and attachments.
+        paths.append(str(agent_dir))
+        for root, dirs, files in os.walk(agent_dir):
+            paths.extend(os.path.join(root, name) for name in dirs)
+            paths.extend(os.path.join(root, name) for name in files)
+    return paths
+
+
+def load_cached_config(config_path: Path) -> SubAgentConfig | None:
+    """Return the cached configuration for ``config_path`` if none of its inputs changed.
+
+    Configurations loaded earlier in the same process are returned as the same instance,
+    so callers must treat the result as read-only.
+    """
+
+    cache_file = _cache_file(config_path)
+    if cache_file is None:
+        return None
+
+    key = str(config_path.absolute())
+    loaded = _loaded.get(key)
+    if loaded is not None:
+        fingerprint, cfg = loaded
+        if _fingerprint(path for path, _, _ in fingerprint) == fingerprint:
+            return cfg
+        del _loaded[key]
+
+    try:
+        with cache_file.open("rb") as fh:
+            # Check the handle that is read, so the file cannot be swapped after the check.
+            if not _is_private(os.fstat(fh.fileno())):
+                return None
+            data = memoryview(fh.read())
+        (header_length,) = _HEADER_LENGTH.unpack_from(data)
+        payload_start = _HEADER_LENGTH.size + header_length
+        header = _json.loads(data[_HEADER_LENGTH.size : payload_start])
+        if header["build"] != _cache_build():
+            return None
+        fingerprint = tuple((path, mtime_ns, size) for path, mtime_ns, size in header["fingerprint"])
+        if _fingerprint(path for path, _, _ in fingerprint) != fingerprint:
+            return None
+        cfg = pickle.loads(data[payload_start:])
+    except Exception:  # noqa: BLE001 - any unreadable or stale entry is just a cache miss
+        return None
+    # The header already pins the release and model layout, so the instance is used as-is.
+    if not isinstance(cfg, SubAgentConfig):
+        return None
+
+    _loaded[key] = (fingerprint, cfg)
+    return cfg
+
+
+def clear_loaded_configs() -> None:
+    """Forget configurations memoized in this process (the on-disk cache is kept)."""
+
+    _loaded.clear()
+
+
+def store_cached_config(config_path: Path, agent_dirs: Iterable[Path], cfg: SubAgentConfig) -> None:
+    """Persist ``cfg`` alongside the fingerprint of every file it was loaded from.
+
+    Caching is best effort: failures to write are ignored, and configurations whose
+    inputs were modified within the last couple of seconds are not cached at all.
+    """
+
+    cache_file = _cache_file(config_path)
+    if cache_file is None:
+        return
+
+    fingerprint = _fingerprint(_expand_dependencies(config_path, agent_dirs))
+    racy_after = time.time_ns() - _RACY_WINDOW_NS
+    if any(mtime_ns > racy_after for _, mtime_ns, _ in fingerprint):
+        return
+
+    _loaded[str(config_path.absolute())] = (fingerprint, cfg)
+
+    tmp_path = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        header = _json.dumps({"build": _cache_build(), "fingerprint": fingerprint})
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(_HEADER_LENGTH.pack(len(header)))
+            fh.write(header)
+            pickle.dump(cfg, fh, protocol=5)
+        os.replace(tmp_path, cache_file)
+    except (OSError, TypeError, pickle.PicklingError):
+        tmp_path.unlink(missing_ok=True)
+
+
+__all__ = ["clear_loaded_configs", "load_cached_config", "store_cached_config"]
@@ -0,0 +1,47 @@
+"""JSON helpers that use orjson when it is installed and fall back to the stdlib."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+#: Raised by :func:`loads`; orjson's error type subclasses it.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Decode a JSON document."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON bytes."""
+
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_pretty(obj: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+    """Encode ``obj`` as JSON text indented by two spaces.
+
+    ``default`` is called for objects that are not natively serializable, as with
+    :func:`json.dumps`.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2, default=default)
+
+
+__all__ = ["JSONDecodeError", "dumps", "dumps_pretty", "loads"]
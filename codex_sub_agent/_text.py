@@ -0,0 +1,20 @@
+"""Helpers for reading the text files that make up a configuration bundle."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def read_utf8(path: Path) -> str:
+    """Read ``path`` as UTF-8 with universal newlines, like ``Path.read_text``.
+
+    Reading bytes and decoding them skips building a text-mode wrapper for every file.
+    """
+
+    text = path.read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+__all__ = ["read_utf8"]
@@ -0,0 +1,29 @@
+"""TOML helpers that use rtoml when it is installed and fall back to the stdlib."""
+
+from __future__ import annotations
+
+import tomllib
+from pathlib import Path
+from typing import Any
+
+try:
+    import rtoml  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - rtoml is an optional speedup
+    rtoml = None  # type: ignore[assignment]
+
+#: Exceptions raised by :func:`load_path` for malformed documents.
+TOMLDecodeError: tuple[type[Exception], ...] = (
+    (tomllib.TOMLDecodeError, rtoml.TomlParsingError) if rtoml is not None else (tomllib.TOMLDecodeError,)
+)
+
+
+def load_path(path: Path) -> dict[str, Any]:
+    """Read ``path`` in one call and parse it as a TOML document."""
+
+    data = path.read_bytes()
+    if rtoml is not None:
+        return rtoml.loads(data.decode("utf-8"))
+    return tomllib.loads(data.decode("utf-8"))
+
+
+__all__ = ["TOMLDecodeError", "load_path"]
@@ -2,42 +2,96 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import re
-from dataclasses import dataclass
-from typing import Any, Iterable
-
-from agents import Agent, ModelSettings
-import mcp.types as mcp_types
+import string
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Container, Iterable, Iterator
 
 from .config_models import AgentSettings, InvalidConfiguration, SubAgentConfig
 
+if TYPE_CHECKING:  # pragma: no cover - the Agents SDK and MCP types load lazily at runtime
+    import mcp.types as mcp_types
+    from agents import Agent, ModelSettings
+    from agents.tool import FunctionTool
+
+    from .skills import AgentSkillAttachment
+
+_TOOL_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+_SANITIZE_TABLE = str.maketrans({chr(code): "_" for code in range(128) if chr(code) not in _TOOL_NAME_CHARS})
+_MAX_TOOL_NAME_LENGTH = 64
+# Only consulted for non-ASCII aliases, which the translate table leaves untouched.
+_SANITIZE_RE = re.compile(r"[^A-Za-z0-9_-]")
+# Shared by every exposed tool definition; treat as read-only.
+_TOOL_INPUT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "request": {
+            "type": "string",
+            "description": "Optional override for the agent's entry message.",
+        }
+    },
+    "additionalProperties": False,
+}
+
 
-@dataclass(frozen=True)
+def _suffixed(name: str, index: int) -> str:
+    """Append ``_<index>`` to ``name`` without exceeding the tool-name length limit."""
+
+    suffix = f"_{index}"
+    return f"{name[: _MAX_TOOL_NAME_LENGTH - len(suffix)]}{suffix}"
+
+
+@dataclass(frozen=True, slots=True)
 class AgentBlueprint:
     """Immutable recipe for constructing an Agents SDK Agent."""
 
     agent_id: str
     settings: AgentSettings
-    mcp_server_names: list[str]
+    mcp_server_names: tuple[str, ...]
+    _model_settings: ModelSettings | None = field(default=None, init=False, repr=False, compare=False)
+    _skill_tools: tuple[FunctionTool, ...] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def model_settings(self) -> ModelSettings:
+        """Return a fresh copy of the blueprint's model settings, computed once."""
+
+        model_settings = self._model_settings
+        if model_settings is None:
+            from agents import ModelSettings
+
+            model_settings = ModelSettings()
+            if self.settings.temperature is not None:
+                model_settings.temperature = self.settings.temperature
+            if self.settings.reasoning_tokens:
+                model_settings.max_tokens = self.settings.reasoning_tokens
+            object.__setattr__(self, "_model_settings", model_settings)
+        return copy.copy(model_settings)
+
+    def skill_tools(self) -> tuple[FunctionTool, ...]:
+        """Return the function tools for the agent's skills, built on first use."""
+
+        skill_tools = self._skill_tools
+        if skill_tools is None:
+            skill_tools = tuple(skill.build_tool(self.agent_id) for skill in self.settings.skills)
+            object.__setattr__(self, "_skill_tools", skill_tools)
+        return skill_tools
 
     def build_agent(self, tools: list[Any], mcp_servers: Iterable[Any]) -> Agent[Any]:
-        model_settings = ModelSettings()
-        if self.settings.temperature is not None:
-            model_settings.temperature = self.settings.temperature
-        if self.settings.reasoning_tokens:
-            model_settings.max_tokens = self.settings.reasoning_tokens
+        from agents import Agent
 
         return Agent(
             name=self.settings.name,
             instructions=self.settings.instructions,
             model=self.settings.model,
-            model_settings=model_settings,
+            model_settings=self.model_settings(),
             tools=tools,
-            mcp_servers=list(mcp_servers),
+            mcp_servers=list(mcp_servers) if self.mcp_server_names else [],
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentAliasEntry:
     alias: str
     tool_name: str
@@ -56,7 +110,7 @@ class AgentRegistry:
             agent_id: AgentBlueprint(
                 agent_id=agent_id,
                 settings=settings,
-                mcp_server_names=list(settings.mcp_servers),
+                mcp_server_names=tuple(settings.mcp_servers),
             )
             for agent_id, settings in agents.items()
         }
@@ -65,92 +119,161 @@ class AgentRegistry:
             raise InvalidConfiguration("No aliases defined in [aliases]. At least one alias is required.")
 
         self.tool_entries: dict[str, AgentAliasEntry] = {}
-        self.aliases_by_agent: dict[str, list[str]] = {agent_id: [] for agent_id in agents}
-        used_tool_names: set[str] = set()
+        aliases_by_agent: dict[str, list[str]] = {agent_id: [] for agent_id in agents}
+        self._next_suffix: dict[str, int] = {}
+        self._summaries: dict[str, str] = {}
 
         for alias, agent_id in config.aliases.items():
             blueprint = self._blueprints.get(agent_id)
             if blueprint is None:
                 raise InvalidConfiguration(f"Alias '{alias}' references unknown agent '{agent_id}'.")
-            tool_name = self._make_tool_name(alias, used_tool_names)
-            used_tool_names.add(tool_name)
+            tool_name = self._make_tool_name(alias, self.tool_entries, self._next_suffix)
             entry = AgentAliasEntry(
                 alias=alias,
                 tool_name=tool_name,
                 blueprint=blueprint,
-                description=self._summarize_agent(blueprint),
+                description=self._summary_for(agent_id),
                 expose_in_tools=True,
             )
             self.tool_entries[tool_name] = entry
-            self.aliases_by_agent[agent_id].append(alias)
-
-        self.cli_aliases: dict[str, AgentAliasEntry] = {}
-        for entry in self.tool_entries.values():
-            self.cli_aliases[entry.alias] = entry
-            self.cli_aliases[entry.tool_name] = entry
-
-        for agent_id, blueprint in self._blueprints.items():
-            if agent_id not in self.cli_aliases:
-                fallback_tool = self._make_tool_name(agent_id, used_tool_names)
-                entry = AgentAliasEntry(
-                    alias=agent_id,
-                    tool_name=fallback_tool,
-                    blueprint=blueprint,
-                    description=self._summarize_agent(blueprint),
-                    expose_in_tools=False,
-                )
-                self.cli_aliases[agent_id] = entry
-                self.cli_aliases[fallback_tool] = entry
-
-        self.tool_definitions: list[mcp_types.Tool] = [
-            mcp_types.Tool(
-                name=entry.tool_name,
-                description=entry.description,
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "request": {
-                            "type": "string",
-                            "description": "Optional override for the agent's entry message.",
-                        }
-                    },
-                    "additionalProperties": False,
-                },
+            aliases_by_agent[agent_id].append(alias)
+        for agent_aliases in aliases_by_agent.values():
+            agent_aliases.sort()
+        self.aliases_by_agent = aliases_by_agent
+
+        cli_aliases: dict[str, AgentAliasEntry] = {
+            key: entry for entry in self.tool_entries.values() for key in (entry.alias, entry.tool_name)
+        }
+
+        # Agents without an explicit alias stay reachable from the CLI under their id. Fallback
+        # tool names avoid every CLI key and every fallback id, so none shadows another entry.
+        fallback_ids = [agent_id for agent_id in self._blueprints if agent_id not in cli_aliases]
+        taken = set(cli_aliases).union(fallback_ids)
+        for agent_id in fallback_ids:
+            # An agent's fallback tool may share its own id.
+            taken.discard(agent_id)
+            fallback_tool = self._make_tool_name(agent_id, taken, self._next_suffix)
+            taken.update((agent_id, fallback_tool))
+            entry = AgentAliasEntry(
+                alias=agent_id,
+                tool_name=fallback_tool,
+                blueprint=self._blueprints[agent_id],
+                description=self._summary_for(agent_id),
+                expose_in_tools=False,
             )
-            for entry in sorted(self.tool_entries.values(), key=lambda e: e.tool_name)
+            cli_aliases[agent_id] = entry
+            cli_aliases[fallback_tool] = entry
+        self.cli_aliases = cli_aliases
+        # Tool names duplicate their aliases in cli_aliases; list each entry once in errors.
+        self._sorted_alias_names = ", ".join(sorted({entry.alias for entry in cli_aliases.values()}))
+
+        self._sorted_summaries: tuple[tuple[str, AgentSettings, list[str]], ...] = tuple(
+            (agent_id, blueprint.settings, aliases_by_agent[agent_id])
+            for agent_id, blueprint in sorted(self._blueprints.items())
+        )
+
+    @cached_property
+    def tool_definitions(self) -> list[mcp_types.Tool]:
+        """MCP tool metadata for every exposed alias, built on first access."""
+
+        import mcp.types as mcp_types
+
+        # Validate the shared schema once, then stamp out per-alias copies without revalidating it.
+        template = mcp_types.Tool(name="agent", description="", inputSchema=_TOOL_INPUT_SCHEMA)
+        return [
+            template.model_copy(update={"name": entry.tool_name, "description": entry.description})
+            for _, entry in sorted(self.tool_entries.items())
         ]
 
+    @cached_property
+    def list_tools_result(self) -> mcp_types.ListToolsResult:
+        """Shared ``tools/list`` response; the tool set is fixed for the registry's lifetime."""
+
+        import mcp.types as mcp_types
+
+        return mcp_types.ListToolsResult(tools=self.tool_definitions)
+
+    @cached_property
+    def _skill_resources(self) -> dict[str, tuple[mcp_types.Resource, AgentSkillAttachment]]:
+        import mcp.types as mcp_types
+
+        resources: dict[str, tuple[mcp_types.Resource, AgentSkillAttachment]] = {}
+        for agent_id, blueprint in sorted(self._blueprints.items()):
+            for skill in blueprint.settings.skills:
+                for attachment in skill.resolve_attachments():
+                    resource = mcp_types.Resource(
+                        uri=skill.resource_uri(agent_id, attachment),
+                        name=f"{skill.name}: {attachment.relative_path}",
+                        mimeType="text/plain",
+                        size=attachment.size_bytes,
+                    )
+                    # Key on the validated URI so lookups match what clients send back.
+                    resources[str(resource.uri)] = (resource, attachment)
+        return resources
+
+    @cached_property
+    def resource_definitions(self) -> list[mcp_types.Resource]:
+        """MCP resource metadata for every skill attachment, built on first access."""
+
+        return [resource for resource, _ in self._skill_resources.values()]
+
+    def resolve_skill_resource(self, uri: str) -> AgentSkillAttachment:
+        entry = self._skill_resources.get(uri)
+        if entry is None:
+            raise InvalidConfiguration(f"Unknown resource '{uri}'.")
+        return entry[1]
+
     def resolve_tool_name(self, tool_name: str) -> AgentAliasEntry:
-        if tool_name not in self.tool_entries:
+        entry = self.tool_entries.get(tool_name)
+        if entry is None:
             raise InvalidConfiguration(f"Unknown tool '{tool_name}'.")
-        return self.tool_entries[tool_name]
+        return entry
 
     def resolve_cli_alias(self, alias: str) -> AgentAliasEntry:
-        if alias not in self.cli_aliases:
-            raise InvalidConfiguration(f"Unknown agent '{alias}'. Available: {', '.join(sorted(self.cli_aliases))}")
-        return self.cli_aliases[alias]
+        entry = self.cli_aliases.get(alias)
+        if entry is None:
+            raise InvalidConfiguration(f"Unknown agent '{alias}'. Available: {self._sorted_alias_names}")
+        return entry
 
-    def iter_agent_summaries(self):
-        for agent_id, blueprint in sorted(self._blueprints.items()):
-            yield agent_id, blueprint.settings, sorted(self.aliases_by_agent.get(agent_id, []))
+    def iter_agent_summaries(self) -> Iterator[tuple[str, AgentSettings, list[str]]]:
+        return iter(self._sorted_summaries)
+
+    def _summary_for(self, agent_id: str) -> str:
+        summary = self._summaries.get(agent_id)
+        if summary is None:
+            summary = self._summaries[agent_id] = self._summarize_agent(self._blueprints[agent_id])
+        return summary
 
     @staticmethod
     def _summarize_agent(blueprint: AgentBlueprint) -> str:
-        primary_line = blueprint.settings.instructions.strip().splitlines()[0].strip()
+        text = blueprint.settings.instructions
+        start = 0
+        length = len(text)
+        while start < length and text[start].isspace():
+            start += 1
+        newline = text.find("\n", start)
+        primary_line = text[start : length if newline == -1 else newline].rstrip()
         if len(primary_line) > 200:
             primary_line = primary_line[:197].rstrip() + "..."
         return f"{blueprint.settings.name}: {primary_line}"
 
     @staticmethod
-    def _make_tool_name(alias: str, used: set[str]) -> str:
-        sanitized = re.sub(r"[^A-Za-z0-9_-]", "_", alias)
+    def _make_tool_name(alias: str, used: Container[str], next_index: dict[str, int]) -> str:
+        sanitized = alias.translate(_SANITIZE_TABLE)
+        if not sanitized.isascii():
+            sanitized = _SANITIZE_RE.sub("_", sanitized)
         sanitized = sanitized.strip("_") or "agent"
-        candidate = sanitized
-        index = 2
+        if len(sanitized) > _MAX_TOOL_NAME_LENGTH:
+            # Model providers reject longer tool names; keep truncated names distinct via a digest.
+            digest = hashlib.blake2b(sanitized.encode(), digest_size=4).hexdigest()
+            sanitized = f"{sanitized[: _MAX_TOOL_NAME_LENGTH - len(digest) - 1]}_{digest}"
+        index = next_index.get(sanitized, 1)
+        candidate = sanitized if index == 1 else _suffixed(sanitized, index)
         while candidate in used:
-            candidate = f"{sanitized}_{index}"
             index += 1
-        if not re.fullmatch(r"[A-Za-z0-9_-]+", candidate):
+            candidate = _suffixed(sanitized, index)
+        next_index[sanitized] = index + 1
+        if not _TOOL_NAME_CHARS.issuperset(candidate):
             raise InvalidConfiguration(f"Cannot derive a valid tool name from alias '{alias}'.")
         return candidate
 
@@ -1,22 +1,27 @@
 """Command-line entry point and MCP server implementation for Codex sub-agents."""
 
+from __future__ import annotations
+
 import argparse
 import asyncio
+import functools
 import importlib.resources as importlib_resources
-import json
 import os
 import shutil
 import subprocess
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Coroutine, TypeVar
+
+from . import _json
 
-from agents import set_default_openai_api, set_default_openai_key
+if TYPE_CHECKING:  # pragma: no cover - the config and runtime modules load lazily in main()
+    from .config_loader import SubAgentConfig
 
-from .agent_runtime import AgentRegistry
-from .config_loader import InvalidConfiguration, SubAgentConfig, load_config
-from . import mcp_server
+_T = TypeVar("_T")
 
 
+@functools.lru_cache(maxsize=1)
 def _default_config_path() -> Path | None:
     """Return the packaged configuration file shipped with the module."""
 
@@ -25,6 +30,10 @@ def _default_config_path() -> Path | None:
     except ModuleNotFoundError:  # pragma: no cover - only during broken installs
         return None
 
+    if isinstance(resource, os.PathLike):
+        # Regular installs expose a real filesystem path; no need to extract via as_file.
+        return Path(resource) if resource.is_file() else None
+
     try:
         with importlib_resources.as_file(resource) as resolved:
             if resolved.exists():
@@ -47,7 +56,7 @@ def build_main_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--config",
         type=Path,
-        default=_default_config_path(),
+        default=None,
         help="Path to codex_sub_agents.toml (defaults to the packaged config).",
     )
     parser.add_argument(
@@ -89,7 +98,7 @@ def build_configure_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--codex-config",
         type=Path,
-        default=Path.cwd() / ".codex" / "config.toml",
+        default=None,
         help="Path to the Codex config file (default: ./.codex/config.toml).",
     )
     return parser
@@ -106,36 +115,29 @@ def _load_env_from_direnv(directory: Path) -> dict[str, str]:
         raise RuntimeError("direnv executable not found in PATH.")
 
     command = ["direnv", "export", "json"]
-    result = subprocess.run(command, cwd=str(directory), capture_output=True, text=True)
+    result = subprocess.run(command, cwd=str(directory), capture_output=True)
     if result.returncode != 0:
-        error_output = result.stderr.strip() or "direnv export failed"
+        error_output = result.stderr.decode("utf-8", errors="replace").strip() or "direnv export failed"
         raise RuntimeError(error_output)
 
     try:
-        payload = json.loads(result.stdout or "{}")
-    except json.JSONDecodeError as exc:
+        payload = _json.loads(result.stdout or b"{}")
+    except _json.JSONDecodeError as exc:
         raise RuntimeError("direnv export produced invalid JSON output.") from exc
 
     if not isinstance(payload, dict):
         raise RuntimeError("direnv export response must be a JSON object.")
 
-    env_map: dict[str, str] = {}
-    for key, value in payload.items():
-        if isinstance(value, str):
-            env_map[key] = value
-    return env_map
+    return {key: value for key, value in payload.items() if isinstance(value, str)}
 
 
 def _populate_env_from_envrc(config: SubAgentConfig) -> None:
     """Ensure required env vars are populated via direnv when available."""
 
-    required: list[str] = []
-    if config.openai.api_key_env_var:
-        required.append(config.openai.api_key_env_var)
-
-    missing = [var for var in required if var and not os.environ.get(var)]
-    if not missing:
+    env_var = config.openai.api_key_env_var
+    if not env_var or os.environ.get(env_var):
         return
+    missing = [env_var]
 
     envrc_path = Path.cwd() / ".envrc"
     if not envrc_path.exists():
@@ -153,6 +155,18 @@ def _populate_env_from_envrc(config: SubAgentConfig) -> None:
             os.environ[var] = value
 
 
+def _run_async(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run ``coro`` to completion, on uvloop when it is installed."""
+
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return asyncio.run(coro)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
 def ensure_openai_setup(config: SubAgentConfig) -> None:
     """Validate and configure shared OpenAI credentials for the Agents SDK.
 
@@ -162,6 +176,8 @@ def ensure_openai_setup(config: SubAgentConfig) -> None:
     Raises:
         RuntimeError: If the required API key environment variable is missing.
     """
+    from agents import set_default_openai_api, set_default_openai_key
+
     api_key = os.environ.get(config.openai.api_key_env_var)
     if not api_key:
         raise RuntimeError(
@@ -186,28 +202,30 @@ def main(argv: list[str] | None = None) -> int:
     if argv and argv[0] == "configure":
         config_parser = build_configure_parser()
         args = config_parser.parse_args(argv[1:])
-        return configure_codex(args.config, args.codex_config)
+        codex_config = args.codex_config or Path.cwd() / ".codex" / "config.toml"
+        return configure_codex(args.config, codex_config)
 
     parser = build_main_parser()
     args = parser.parse_args(argv)
 
-    if args.config is None:
+    from .agent_runtime import AgentRegistry
+    from .config_loader import InvalidConfiguration, load_config
+
+    config_path = args.config if args.config is not None else _default_config_path()
+    if config_path is None:
         parser.error(
             "No configuration file supplied. Pass --config with the path to codex_sub_agents.toml."
         )
 
-    config_path = args.config.expanduser()
-    if not config_path.exists():
-        parser.error(f"Configuration file not found: {config_path}")
-
     try:
-        config = load_config(config_path)
+        config = load_config(config_path.expanduser())
         _populate_env_from_envrc(config)
         registry = AgentRegistry(config)
     except InvalidConfiguration as exc:
         parser.error(str(exc))
 
     if args.list_agents:
+        lines: list[str] = []
         for agent_id, settings, aliases in registry.iter_agent_summaries():
             alias_render: list[str] = []
             for alias in aliases:
@@ -217,7 +235,8 @@ def main(argv: list[str] | None = None) -> int:
                 else:
                     alias_render.append(alias)
             alias_text = f" aliases={alias_render}" if alias_render else ""
-            print(f"{agent_id}: {settings.name}{alias_text}")
+            lines.append(f"{agent_id}: {settings.name}{alias_text}\n")
+        sys.stdout.write("".join(lines))
         return 0
 
     if args.run_agent:
@@ -226,8 +245,10 @@ def main(argv: list[str] | None = None) -> int:
         except InvalidConfiguration as exc:
             parser.error(str(exc))
         ensure_openai_setup(config)
+        from . import mcp_server
+
         try:
-            run_result = asyncio.run(mcp_server.run_agent_workflow(entry, config, args.request))
+            run_result = _run_async(mcp_server.run_agent_workflow(entry, config, args.request))
             print(mcp_server.format_run_result(entry, run_result))
             return 0
         except Exception as exc:  # pragma: no cover - CLI surface
@@ -235,8 +256,10 @@ def main(argv: list[str] | None = None) -> int:
             return 1
 
     ensure_openai_setup(config)
+    from . import mcp_server
+
     try:
-        asyncio.run(mcp_server.serve(config, registry))
+        _run_async(mcp_server.serve(config, registry))
         return 0
     except KeyboardInterrupt:
         return 0
@@ -245,6 +268,17 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
 
+_STANZA_HEADER = "[mcp_servers.codex_sub_agent]"
+_STANZA_HEADER_BYTES = _STANZA_HEADER.encode()
+_STANZA_TEMPLATE = (
+    f"{_STANZA_HEADER}\n"
+    'command = "codex-sub-agent"\n'
+    'args = ["--config", "{config_path}"]\n'
+    "startup_timeout_sec = 60\n"
+    "client_session_timeout_seconds = 3600\n"
+)
+
+
 def configure_codex(config_path: Path, codex_config_path: Path) -> int:
     """Write the codex-sub-agent stanza into ./.codex/config.toml.
 
@@ -255,32 +289,33 @@ def configure_codex(config_path: Path, codex_config_path: Path) -> int:
     Returns:
         Integer exit status suitable for CLI usage.
     """
-    config_path = config_path.expanduser().resolve()
-    if not config_path.exists():
-        print(f"Configuration file not found: {config_path}", file=sys.stderr)
+    config_path = config_path.expanduser()
+    try:
+        config_path = config_path.resolve(strict=True)
+    except FileNotFoundError:
+        print(f"Configuration file not found: {config_path.absolute()}", file=sys.stderr)
         return 1
 
     codex_config_path = codex_config_path.expanduser()
     codex_config_path.parent.mkdir(parents=True, exist_ok=True)
 
-    stanza_header = "[mcp_servers.codex_sub_agent]"
-    stanza = (
-        f"{stanza_header}\n"
-        'command = "codex-sub-agent"\n'
-        f'args = ["--config", "{config_path}"]\n'
-        "startup_timeout_sec = 60\n"
-        "client_session_timeout_seconds = 3600\n"
-    )
+    stanza = _STANZA_TEMPLATE.format(config_path=config_path)
 
-    if codex_config_path.exists():
-        existing_text = codex_config_path.read_text()
-        if stanza_header in existing_text:
-            print(f"{codex_config_path} already contains the codex_sub_agent stanza.")
-            return 0
-        newline = "" if existing_text.endswith("\n") else "\n"
-        codex_config_path.write_text(existing_text + newline + "\n" + stanza)
-    else:
+    try:
+        fh = codex_config_path.open("rb+")
+    except FileNotFoundError:
         codex_config_path.write_text(stanza)
+    else:
+        # Scan line by line and append in place rather than rewriting the whole file.
+        with fh:
+            last_line = b""
+            for line in fh:
+                if _STANZA_HEADER_BYTES in line:
+                    print(f"{codex_config_path} already contains the codex_sub_agent stanza.")
+                    return 0
+                last_line = line
+            newline = b"" if last_line.endswith(b"\n") else b"\n"
+            fh.write(newline + b"\n" + stanza.encode())
 
     print(f"Added codex_sub_agent MCP server configuration to {codex_config_path}")
     return 0
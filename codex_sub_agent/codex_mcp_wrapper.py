@@ -1,8 +1,81 @@
 """Wrapper that launches `npx codex mcp` while filtering Codex-only notifications."""
 
-import json
+import io
+import re
 import subprocess
 import sys
+from typing import IO
+
+from . import _json
+
+_READ_SIZE = 64 * 1024
+_CODEX_EVENT_MARKER = b"codex/event"
+_NON_BLANK = re.compile(rb"\S")
+
+
+def _should_forward(data: bytes | bytearray, start: int, end: int) -> bool:
+    """Return whether the frame ``data[start:end]`` should reach the MCP client.
+
+    The frame is inspected in place so that the common case never copies it.
+    """
+
+    if _NON_BLANK.search(data, start, end) is None:
+        return False
+    if data.find(_CODEX_EVENT_MARKER, start, end) == -1:
+        # Most frames cannot be a Codex event at all, so skip decoding them.
+        return True
+
+    try:
+        payload = _json.loads(memoryview(data)[start:end])
+    except (_json.JSONDecodeError, UnicodeDecodeError):
+        return True
+
+    # Codex CLI emits telemetry via `codex/event`; the python MCP client
+    # rejects unknown notification types, so we silently drop them here.
+    return not (isinstance(payload, dict) and payload.get("method") == "codex/event")
+
+
+def _filter_stream(source: io.BufferedReader, sink: IO[bytes]) -> None:
+    """Copy newline-delimited frames from ``source`` to ``sink``, dropping Codex events.
+
+    Reads are issued in large chunks into a reusable buffer and frames are sliced out
+    of it in place; only a frame that straddles two reads is copied into ``tail``.
+    Every frame completed by a chunk is forwarded with one write and one flush so
+    responses are never held back in a buffer.
+    """
+
+    buffer = bytearray(_READ_SIZE)
+    view = memoryview(buffer)
+    tail = bytearray()
+    out = bytearray()
+    while True:
+        # readinto1 performs at most one raw read, so it returns as soon as data arrives.
+        count = source.readinto1(view)
+        if not count:
+            break
+
+        start = 0
+        newline = buffer.find(b"\n", 0, count)
+        while newline != -1:
+            if tail:
+                tail += view[start : newline + 1]
+                if _should_forward(tail, 0, len(tail)):
+                    out += tail
+                tail.clear()
+            elif _should_forward(buffer, start, newline + 1):
+                out += view[start : newline + 1]
+            start = newline + 1
+            newline = buffer.find(b"\n", start, count)
+        tail += view[start:count]
+
+        if out:
+            sink.write(out)
+            sink.flush()
+            out.clear()
+
+    if _should_forward(tail, 0, len(tail)):
+        sink.write(tail)
+        sink.flush()
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -22,30 +95,14 @@ def main(argv: list[str] | None = None) -> int:
         stdin=sys.stdin,
         stdout=subprocess.PIPE,
         stderr=sys.stderr,
-        text=True,
-        bufsize=1,
+        bufsize=-1,
     )
 
-    assert process.stdout is not None
+    # A buffered pipe (bufsize=-1) is what provides readinto1 for _filter_stream.
+    assert isinstance(process.stdout, io.BufferedReader)
 
     try:
-        for line in process.stdout:
-            stripped = line.strip()
-            if not stripped:
-                continue
-
-            try:
-                payload = json.loads(stripped)
-            except json.JSONDecodeError:
-                print(line, end="")
-                continue
-
-            if payload.get("method") == "codex/event":
-                # Codex CLI emits telemetry via `codex/event`; the python MCP client
-                # rejects unknown notification types, so we silently drop them here.
-                continue
-
-            print(line, end="")
+        _filter_stream(process.stdout, sys.stdout.buffer)
     finally:
         if process.stdin:
             process.stdin.close()
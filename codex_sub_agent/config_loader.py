@@ -1,10 +1,14 @@
 """Utilities for loading and validating sub-agent configuration files."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import tomllib
 from pydantic import ValidationError
 
+from . import _toml
+from ._config_cache import load_cached_config, store_cached_config
+from ._text import read_utf8
 from .config_models import (
     SubAgentConfig,
     InvalidConfiguration,
@@ -12,6 +16,8 @@ from .config_models import (
 from .skill_loader import load_agent_skills
 from .skills import render_skill_section
 
+_CONFIG_VALIDATOR = SubAgentConfig.__pydantic_validator__
+
 
 def _normalize_mcp_servers(raw_value: object) -> list[str]:
     """Return a normalized list of MCP server names for an agent configuration."""
@@ -44,6 +50,9 @@ def load_config(config_path: Path) -> SubAgentConfig:
 
     The loader supports inline agent definitions or external agent files declared via
     ``agent_files``. External entries are resolved relative to the main configuration.
+    Validated results are cached on disk (and in memory for the rest of the process) and
+    reused until one of the input files changes, so treat the returned configuration,
+    including its dicts and lists, as read-only; set ``CODEX_SUB_AGENT_CONFIG_NOCACHE=1`` to always parse from scratch.
 
     Args:
         config_path: Path to the root TOML file.
@@ -70,11 +79,10 @@ def load_config(config_path: Path) -> SubAgentConfig:
         default_prompt_path = agent_path / "default_prompt.md"
 
         try:
-            with toml_path.open("rb") as fh:
-                agent_payload = tomllib.load(fh)
+            agent_payload = _toml.load_path(toml_path)
         except FileNotFoundError as exc:
             raise InvalidConfiguration(f"Agent file not found: {toml_path}") from exc
-        except tomllib.TOMLDecodeError as exc:
+        except _toml.TOMLDecodeError as exc:
             raise InvalidConfiguration(f"Failed to parse agent file {toml_path}: {exc}") from exc
 
         agent_id = agent_payload.get("id")
@@ -100,7 +108,7 @@ def load_config(config_path: Path) -> SubAgentConfig:
 
         def _load_markdown(markdown_path: Path, label: str) -> str:
             try:
-                content = markdown_path.read_text(encoding="utf-8").strip()
+                content = read_utf8(markdown_path).strip()
             except FileNotFoundError as exc:
                 raise InvalidConfiguration(
                     f"Agent directory {agent_path} is missing {label} file: {markdown_path.name}"
@@ -122,15 +130,19 @@ def load_config(config_path: Path) -> SubAgentConfig:
 
         return agent_id, agent_data
 
+    cached = load_cached_config(config_path)
+    if cached is not None:
+        return cached
+
     try:
-        with config_path.open("rb") as fh:
-            payload = tomllib.load(fh)
+        payload = _toml.load_path(config_path)
     except FileNotFoundError as exc:
         raise InvalidConfiguration(f"Configuration file not found: {config_path}") from exc
-    except tomllib.TOMLDecodeError as exc:
+    except _toml.TOMLDecodeError as exc:
         raise InvalidConfiguration(f"Failed to parse TOML configuration: {exc}") from exc
 
     base_dir = config_path.parent
+    agent_dirs: list[Path] = []
 
     agent_files = payload.pop("agent_files", [])
     if agent_files:
@@ -144,8 +156,18 @@ def load_config(config_path: Path) -> SubAgentConfig:
         for index, rel_path in enumerate(agent_files):
             if not isinstance(rel_path, str):
                 raise InvalidConfiguration(f"agent_files[{index}] must be a string path.")
-            file_path = (base_dir / rel_path).resolve()
-            agent_id, agent_data = _load_agent_dir(file_path)
+            # Lexical normalization is enough here and avoids realpath() syscalls per entry.
+            agent_dirs.append(Path(os.path.normpath(base_dir.absolute() / rel_path)))
+
+        # Agent directories are independent and I/O bound, so read them concurrently.
+        # Executor.map yields in submission order, so the first failing entry still wins.
+        if len(agent_dirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(agent_dirs))) as executor:
+                loaded = list(executor.map(_load_agent_dir, agent_dirs))
+        else:
+            loaded = [_load_agent_dir(file_path) for file_path in agent_dirs]
+
+        for file_path, (agent_id, agent_data) in zip(agent_dirs, loaded):
             if agent_id in agents_table:
                 raise InvalidConfiguration(
                     f"Duplicate agent id '{agent_id}' defined in {file_path}."
@@ -156,7 +178,7 @@ def load_config(config_path: Path) -> SubAgentConfig:
         payload["default_agent_id"] = payload["default_agent"]
 
     try:
-        cfg = SubAgentConfig.model_validate(payload)
+        cfg = _CONFIG_VALIDATOR.validate_python(payload)
     except ValidationError as exc:
         raise InvalidConfiguration(f"Invalid configuration: {exc}") from exc
 
@@ -165,4 +187,5 @@ def load_config(config_path: Path) -> SubAgentConfig:
             "Missing required MCP server 'codex'. Add `[mcp_servers.codex]` to codex_sub_agents.toml."
         )
 
+    store_cached_config(config_path, agent_dirs, cfg)
     return cfg
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from types import MappingProxyType
+from typing import Any, Literal, Mapping
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class OpenAISettings(BaseModel):
@@ -13,6 +14,8 @@ class OpenAISettings(BaseModel):
     api_key_env_var: str = Field(default="OPENAI_API_KEY")
     default_api: Literal["responses", "chat_completions"] = Field(default="responses")
 
+    model_config = {"frozen": True}
+
 
 class AgentSettings(BaseModel):
     """Concrete configuration for a single sub-agent role."""
@@ -26,6 +29,8 @@ class AgentSettings(BaseModel):
     mcp_servers: list[str] = Field(default_factory=list)
     skills: list["AgentSkill"] = Field(default_factory=list)
 
+    model_config = {"frozen": True}
+
 
 class MCPStdioConfig(BaseModel):
     """Definition for launching an MCP server over stdio."""
@@ -37,6 +42,8 @@ class MCPStdioConfig(BaseModel):
     env: dict[str, str] = Field(default_factory=dict)
     client_session_timeout_seconds: float = Field(default=300.0)
 
+    model_config = {"frozen": True}
+
 
 class MCPHttpConfig(BaseModel):
     """Definition for connecting to an MCP server over HTTP(S)."""
@@ -48,12 +55,27 @@ class MCPHttpConfig(BaseModel):
     bearer_token_env_var: str | None = None
     client_session_timeout_seconds: float = Field(default=60.0)
 
+    model_config = {"frozen": True}
+
+    def request_headers(self, token: str | None) -> dict[str, str]:
+        """Return a new mapping of ``headers`` plus an ``Authorization`` header for ``token``."""
+
+        headers = dict(self.headers)
+        if token:
+            headers.setdefault("Authorization", f"Bearer {token}")
+        return headers
+
 
 MCPConfig = MCPStdioConfig | MCPHttpConfig
 
 
 class SubAgentConfig(BaseModel):
-    """Aggregate data model describing all sub-agent runtime requirements."""
+    """Aggregate data model describing all sub-agent runtime requirements.
+
+    Configurations are shared through the load cache and are read-only. The models are
+    frozen, but their dict and list fields are not, so never mutate those in place either;
+    derive a changed configuration with ``model_copy(update=...)`` instead.
+    """
 
     openai: OpenAISettings = Field(default_factory=OpenAISettings)
     agent: AgentSettings | None = None
@@ -62,15 +84,38 @@ class SubAgentConfig(BaseModel):
     aliases: dict[str, str] = Field(default_factory=dict)
     mcp_servers: dict[str, MCPConfig] = Field(default_factory=dict)
 
-    model_config = {"use_enum_values": True, "populate_by_name": True}
-
-    def _agent_map(self) -> dict[str, AgentSettings]:
+    model_config = {"use_enum_values": True, "populate_by_name": True, "frozen": True}
+
+    # (agents, agent, read-only merged map, lowest agent id); keyed on identity so
+    # model_copy(update=...) invalidates it.
+    _agent_map_cache: tuple[object, object, Mapping[str, AgentSettings], str | None] | None = PrivateAttr(
+        default=None
+    )
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # The cache is derived state (and mapping proxies cannot be pickled); rebuild it lazily.
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+        if private:
+            state["__pydantic_private__"] = {**private, "_agent_map_cache": None}
+        return state
+
+    def _agent_map_entry(self) -> tuple[object, object, Mapping[str, AgentSettings], str | None]:
+        cached = self._agent_map_cache
+        if cached is not None and cached[0] is self.agents and cached[1] is self.agent:
+            return cached
         mapping: dict[str, AgentSettings] = dict(self.agents)
         if self.agent is not None:
             mapping.setdefault("default", self.agent)
-        return mapping
+        # Hand out a read-only view so callers cannot corrupt the shared cache.
+        cached = (self.agents, self.agent, MappingProxyType(mapping), min(mapping) if mapping else None)
+        self._agent_map_cache = cached
+        return cached
 
-    def available_agents(self) -> dict[str, AgentSettings]:
+    def _agent_map(self) -> Mapping[str, AgentSettings]:
+        return self._agent_map_entry()[2]
+
+    def available_agents(self) -> Mapping[str, AgentSettings]:
         agents = self._agent_map()
         if not agents:
             raise InvalidConfiguration("Configuration must define at least one agent.")
@@ -93,7 +138,8 @@ class SubAgentConfig(BaseModel):
                 )
             return self.default_agent_id, agents[self.default_agent_id]
 
-        chosen = sorted(agents)[0]
+        chosen = self._agent_map_entry()[3]
+        assert chosen is not None  # available_agents() rejects an empty roster
         return chosen, agents[chosen]
 
 
@@ -103,6 +149,11 @@ class InvalidConfiguration(Exception):
 
 from .skills import AgentSkill  # noqa: E402  (circular-friendly import)
 
+# Resolve the forward reference now so the core schemas are built once at import rather
+# than lazily on the first validation call.
+AgentSettings.model_rebuild()
+SubAgentConfig.model_rebuild()
+
 __all__ = [
     "AgentSettings",
     "InvalidConfiguration",
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
-from contextlib import AsyncExitStack
-from typing import Any, Iterable
+import shutil
+from contextlib import AsyncExitStack, suppress
+from typing import Any, Awaitable, Callable, Iterable
 
 from agents import Runner, Tool
 from agents.mcp import (
@@ -16,12 +18,13 @@ from agents.mcp import (
     MCPServerStreamableHttpParams,
 )
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.stdio import stdio_server
 import mcp.types as mcp_types
 
-from . import __version__
+from . import __version__, _json
 from .agent_runtime import AgentAliasEntry, AgentRegistry
-from .config_models import MCPHttpConfig, MCPStdioConfig, SubAgentConfig
+from .config_models import InvalidConfiguration, MCPHttpConfig, MCPStdioConfig, SubAgentConfig
 
 
 async def serve(config: SubAgentConfig, registry: AgentRegistry) -> int:
@@ -32,25 +35,56 @@ async def serve(config: SubAgentConfig, registry: AgentRegistry) -> int:
         version=__version__,
         instructions="Codex sub-agent server that exposes configured workflows as MCP tools.",
     )
-    tool_lock = asyncio.Lock()
+    # Started MCP servers are reused by every call. A server is used by one call at a time
+    # (tool-less agents are serialized per agent); everything else runs concurrently.
+    server_pool = MCPServerPool(config)
+    locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+    def _lock(kind: str, name: str) -> asyncio.Lock:
+        lock = locks.get((kind, name))
+        if lock is None:
+            lock = locks[(kind, name)] = asyncio.Lock()
+        return lock
 
     @server.list_tools()
     async def handle_list_tools() -> mcp_types.ListToolsResult:
-        return mcp_types.ListToolsResult(tools=registry.tool_definitions)
+        return registry.list_tools_result
+
+    @server.list_resources()
+    async def handle_list_resources() -> list[mcp_types.Resource]:
+        return registry.resource_definitions
+
+    @server.read_resource()
+    async def handle_read_resource(uri: Any) -> list[ReadResourceContents]:
+        attachment = registry.resolve_skill_resource(str(uri))
+        text = await asyncio.to_thread(attachment.read_text)
+        return [ReadResourceContents(content=text, mime_type="text/plain")]
 
     @server.call_tool()
     async def handle_call_tool(tool_name: str, arguments: dict[str, Any]):
-        async with tool_lock:
-            entry = registry.resolve_tool_name(tool_name)
-            request_override = None
-            if arguments:
-                maybe_request = arguments.get("request")
-                if maybe_request is not None and not isinstance(maybe_request, str):
-                    raise ValueError("The 'request' argument must be a string when provided.")
-                request_override = maybe_request
+        entry = registry.resolve_tool_name(tool_name)
+        request_override = None
+        if arguments:
+            maybe_request = arguments.get("request")
+            if maybe_request is not None and not isinstance(maybe_request, str):
+                raise ValueError("The 'request' argument must be a string when provided.")
+            request_override = maybe_request
+
+        server_names = sorted(set(entry.blueprint.mcp_server_names))
+        # Always acquire in sorted order so overlapping server sets cannot deadlock.
+        call_locks = [_lock("server", name) for name in server_names] or [_lock("agent", entry.blueprint.agent_id)]
+        async with AsyncExitStack() as held:
+            for lock in call_locks:
+                await held.enter_async_context(lock)
             try:
-                run_result = await run_agent_workflow(entry, registry.config, request_override)
-                text = format_run_result(entry, run_result)
+                run_result = await run_agent_workflow(
+                    entry, registry.config, request_override, server_pool=server_pool
+                )
+                if isinstance(getattr(run_result, "final_output", None), str):
+                    text = format_run_result(entry, run_result)
+                else:
+                    # Structured output is pretty-printed as JSON; keep that off the event loop.
+                    text = await asyncio.to_thread(format_run_result, entry, run_result)
                 return mcp_types.CallToolResult(
                     content=[mcp_types.TextContent(type="text", text=text)],
                     isError=False,
@@ -61,9 +95,12 @@ async def serve(config: SubAgentConfig, registry: AgentRegistry) -> int:
                     isError=True,
                 )
 
-    async with stdio_server() as (read_stream, write_stream):
-        initialization = server.create_initialization_options()
-        await server.run(read_stream, write_stream, initialization)
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            initialization = server.create_initialization_options()
+            await server.run(read_stream, write_stream, initialization)
+    finally:
+        await server_pool.aclose()
 
     return 0
 
@@ -80,13 +117,12 @@ def format_run_result(alias_entry: AgentAliasEntry, result: Any) -> str:
     """
 
     final_output = getattr(result, "final_output", None)
-    if isinstance(final_output, str) and final_output.strip():
+    # isspace() answers "is anything printable here?" without copying like strip() would.
+    if isinstance(final_output, str) and final_output and not final_output.isspace():
         return final_output
     if final_output:
         try:
-            import json
-
-            return json.dumps(final_output, indent=2, default=str)
+            return _json.dumps_pretty(final_output, default=str)
         except Exception:  # pragma: no cover
             return str(final_output)
 
@@ -95,33 +131,54 @@ def format_run_result(alias_entry: AgentAliasEntry, result: Any) -> str:
     return f"Agent '{alias_entry.alias}' completed via {last_agent_name}, but no final output was produced."
 
 
-async def run_agent_workflow(alias_entry: AgentAliasEntry, config: SubAgentConfig, requested_prompt: str | None):
+async def run_agent_workflow(
+    alias_entry: AgentAliasEntry,
+    config: SubAgentConfig,
+    requested_prompt: str | None,
+    *,
+    server_pool: MCPServerPool | None = None,
+):
     """Execute a configured agent end-to-end.
 
     Args:
         alias_entry: Agent alias/blueprint describing model settings and servers.
         config: Validated configuration containing MCP server definitions.
         requested_prompt: Optional override for the agent's default prompt.
+        server_pool: Long-lived servers to reuse. Without one, the agent's servers are
+            started for this run and stopped when it finishes.
 
     Returns:
         Whatever :func:`agents.Runner.run` returns for the invoked agent.
     """
 
-    servers, exit_stack = await initialize_mcp_servers(config, alias_entry.blueprint.mcp_server_names)
+    blueprint = alias_entry.blueprint
+    tools: list[Tool] = list(blueprint.skill_tools())
+    entry = requested_prompt or blueprint.settings.default_prompt
+    if not blueprint.mcp_server_names:
+        # Nothing to start or tear down for tool-less agents.
+        return await Runner.run(blueprint.build_agent(tools=tools, mcp_servers=()), entry)
+
+    if server_pool is not None:
+        servers = await server_pool.acquire(blueprint.mcp_server_names)
+        try:
+            return await Runner.run(blueprint.build_agent(tools=tools, mcp_servers=servers.values()), entry)
+        except BaseException:
+            # The failure may have left a session unusable; restart these servers next time.
+            await server_pool.discard(blueprint.mcp_server_names)
+            raise
+
+    servers, teardown = await initialize_mcp_servers(config, blueprint.mcp_server_names)
     try:
-        tools: list[Tool] = [skill.build_tool() for skill in alias_entry.blueprint.settings.skills]
-        agent = alias_entry.blueprint.build_agent(tools=tools, mcp_servers=list(servers.values()))
-        entry = requested_prompt or alias_entry.blueprint.settings.default_prompt
+        agent = blueprint.build_agent(tools=tools, mcp_servers=servers.values())
         return await Runner.run(agent, entry)
     finally:
-        await exit_stack.aclose()
+        await teardown()
 
 
-__all__ = ["serve", "run_agent_workflow", "format_run_result", "initialize_mcp_servers"]
 async def initialize_mcp_servers(
     config: SubAgentConfig,
     server_names: Iterable[str],
-) -> tuple[dict[str, MCPServer], AsyncExitStack]:
+) -> tuple[dict[str, MCPServer], Callable[[], Awaitable[None]]]:
     """Start the MCP servers requested by ``server_names``.
 
     Args:
@@ -129,64 +186,183 @@ async def initialize_mcp_servers(
         server_names: Sequence of server names required by the agent.
 
     Returns:
-        A tuple of (``name -> server`` map, active :class:`AsyncExitStack`). The caller
-        must close the exit stack when the run completes.
+        A tuple of (``name -> server`` map, teardown coroutine function). The caller
+        must await the teardown when the run completes.
 
     Raises:
-        InvalidConfiguration: If a referenced server name is unknown.
+        InvalidConfiguration: If a referenced server name is unknown or a stdio server's
+            command cannot be found.
         RuntimeError: If an HTTP server requires authentication that is missing.
     """
 
+    # Build every server up front so configuration errors surface before anything is started.
+    pending = _build_mcp_servers(config, server_names)
+    if not pending:
+        return {}, _no_teardown
+
+    # Handshakes are independent, so start them concurrently.
+    results = await asyncio.gather(*(server.__aenter__() for _, server in pending), return_exceptions=True)
+
     servers: dict[str, MCPServer] = {}
-    exit_stack = AsyncExitStack()
-    await exit_stack.__aenter__()
+    started: list[MCPServerStdio | MCPServerStreamableHttp] = []
+    failure: BaseException | None = None
+    for (name, server), result in zip(pending, results):
+        if isinstance(result, BaseException):
+            failure = failure or result
+        else:
+            servers[name] = result
+            started.append(server)
+    if failure is not None:
+        with suppress(Exception):
+            await _exit_servers(started)
+        raise failure
+
+    async def teardown() -> None:
+        await _exit_servers(started)
+
+    return servers, teardown
+
+
+async def _no_teardown() -> None:
+    return None
+
 
-    unique_names = list(dict.fromkeys(server_names))
+async def _exit_servers(started: list[MCPServerStdio | MCPServerStreamableHttp]) -> None:
+    """Exit ``started`` in reverse start order, re-raising the first failure once all have exited."""
 
-    for name in unique_names:
+    failure: Exception | None = None
+    for server in reversed(started):
+        try:
+            await server.__aexit__(None, None, None)
+        except Exception as exc:  # noqa: BLE001 - re-raised once every server has exited
+            failure = failure or exc
+    if failure is not None:
+        raise failure
+
+
+def _build_mcp_servers(
+    config: SubAgentConfig,
+    server_names: Iterable[str],
+) -> list[tuple[str, MCPServerStdio | MCPServerStreamableHttp]]:
+    """Construct (without starting) one server per distinct name in ``server_names``."""
+
+    pending: list[tuple[str, MCPServerStdio | MCPServerStreamableHttp]] = []
+    seen: set[str] = set()
+    for name in server_names:
+        if name in seen:
+            continue
+        seen.add(name)
         server_config = config.mcp_servers.get(name)
-        if server_config is None:
-            await exit_stack.aclose()
-            from .config_models import InvalidConfiguration
-
-            raise InvalidConfiguration(f"Agent references unknown MCP server '{name}'.")
-
-        server: MCPServer
-        if isinstance(server_config, MCPStdioConfig):
-            stdio_params: MCPServerStdioParams = {"command": server_config.command}
-            if server_config.args:
-                stdio_params["args"] = server_config.args
-            if server_config.env:
-                stdio_params["env"] = server_config.env
-
-            server = MCPServerStdio(
-                params=stdio_params,
-                name=server_config.name,
-                client_session_timeout_seconds=server_config.client_session_timeout_seconds,
-            )
-        elif isinstance(server_config, MCPHttpConfig):
-            headers = dict(server_config.headers)
-            if server_config.bearer_token_env_var:
-                token = os.environ.get(server_config.bearer_token_env_var)
-                if not token:
-                    raise RuntimeError(
-                        f"Environment variable {server_config.bearer_token_env_var} must be set "
-                        f"to start MCP server '{name}'."
-                    )
-                headers.setdefault("Authorization", f"Bearer {token}")
-
-            stream_params: MCPServerStreamableHttpParams = {"url": server_config.url}
-            if headers:
-                stream_params["headers"] = headers
-
-            server = MCPServerStreamableHttp(
-                params=stream_params,
-                name=server_config.name,
-                client_session_timeout_seconds=server_config.client_session_timeout_seconds,
+        server: MCPServerStdio | MCPServerStreamableHttp
+        match server_config:
+            case MCPStdioConfig():
+                server = _build_stdio_server(server_config)
+            case MCPHttpConfig():
+                server = _build_http_server(name, server_config)
+            case None:
+                raise InvalidConfiguration(f"Agent references unknown MCP server '{name}'.")
+            case _:  # pragma: no cover
+                raise RuntimeError(f"Unsupported MCP server type for {name}")
+        pending.append((name, server))
+    return pending
+
+
+@functools.cache
+def _resolve_command(command: str, search_path: str | None) -> str:
+    """Return the absolute path of ``command`` on ``search_path``, searched once per pair.
+
+    Raises:
+        InvalidConfiguration: If the command cannot be found.
+    """
+
+    resolved = shutil.which(command, path=search_path)
+    if resolved is None:
+        raise InvalidConfiguration(f"MCP server command '{command}' was not found on PATH.")
+    return resolved
+
+
+def _build_stdio_server(server_config: MCPStdioConfig) -> MCPServerStdio:
+    # The server process sees ``env``'s PATH when it overrides one.
+    search_path = server_config.env.get("PATH", os.environ.get("PATH"))
+    stdio_params: MCPServerStdioParams = {"command": _resolve_command(server_config.command, search_path)}
+    if server_config.args:
+        stdio_params["args"] = server_config.args
+    if server_config.env:
+        stdio_params["env"] = server_config.env
+
+    return MCPServerStdio(
+        params=stdio_params,
+        name=server_config.name,
+        client_session_timeout_seconds=server_config.client_session_timeout_seconds,
+    )
+
+
+def _build_http_server(name: str, server_config: MCPHttpConfig) -> MCPServerStreamableHttp:
+    token = None
+    if server_config.bearer_token_env_var:
+        token = os.environ.get(server_config.bearer_token_env_var)
+        if not token:
+            raise RuntimeError(
+                f"Environment variable {server_config.bearer_token_env_var} must be set "
+                f"to start MCP server '{name}'."
             )
-        else:  # pragma: no cover
-            raise RuntimeError(f"Unsupported MCP server type for {name}")
+    headers = server_config.request_headers(token)
+
+    stream_params: MCPServerStreamableHttpParams = {"url": server_config.url}
+    if headers:
+        stream_params["headers"] = headers
+
+    return MCPServerStreamableHttp(
+        params=stream_params,
+        name=server_config.name,
+        client_session_timeout_seconds=server_config.client_session_timeout_seconds,
+    )
+
+
+class MCPServerPool:
+    """MCP servers kept running across tool calls for the lifetime of :func:`serve`.
+
+    Servers are tracked individually so one from a failed run can be discarded (and
+    restarted by the next call) without disturbing the others.
+    """
+
+    def __init__(self, config: SubAgentConfig) -> None:
+        self._config = config
+        self._servers: dict[str, MCPServerStdio | MCPServerStreamableHttp] = {}
+        self._start_lock = asyncio.Lock()
+
+    async def acquire(self, server_names: Iterable[str]) -> dict[str, MCPServer]:
+        """Return started servers for ``server_names``, starting any that are not running yet."""
+
+        names = tuple(server_names)
+        if any(name not in self._servers for name in names):
+            # One starter at a time, so concurrent first calls never spawn a server twice.
+            async with self._start_lock:
+                await self._start_missing(names)
+        return {name: self._servers[name] for name in names}
+
+    async def _start_missing(self, names: tuple[str, ...]) -> None:
+        pending = _build_mcp_servers(self._config, (name for name in names if name not in self._servers))
+        results = await asyncio.gather(*(server.__aenter__() for _, server in pending), return_exceptions=True)
+        failure: BaseException | None = None
+        for (name, _), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                failure = failure or result
+            else:
+                self._servers[name] = result
+        if failure is not None:
+            raise failure
+
+    async def discard(self, server_names: Iterable[str]) -> None:
+        """Stop and forget ``server_names`` so the next :meth:`acquire` starts them afresh."""
+
+        servers = [server for name in server_names if (server := self._servers.pop(name, None))]
+        await asyncio.gather(*(server.__aexit__(None, None, None) for server in servers), return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Stop every pooled server."""
+
+        await self.discard(list(self._servers))
 
-        servers[name] = await exit_stack.enter_async_context(server)
 
-    return servers, exit_stack
+__all__ = ["MCPServerPool", "serve", "run_agent_workflow", "format_run_result", "initialize_mcp_servers"]
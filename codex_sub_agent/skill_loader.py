@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import os
+import re
 from pathlib import Path
 
+from ._text import read_utf8
 from .skills import AgentSkill, AgentSkillAttachment
 from .config_models import InvalidConfiguration
 
+# A line consisting solely of ``---`` (surrounding whitespace allowed). Only ``\n`` ends
+# a line here; files are read with universal newlines, but other separators that
+# ``str.splitlines`` honours (form feed, U+2028, ...) count as part of the line.
+_FENCE_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+_REQUIRED_MANIFEST_KEYS = ("name", "description")
+
 
 def _strip_quotes(value: str) -> str:
     """Return ``value`` without surrounding single or double quotes.
@@ -24,11 +33,11 @@ def _strip_quotes(value: str) -> str:
     return value
 
 
-def _parse_skill_manifest(lines: list[str], skill_file: Path) -> dict[str, str]:
+def _parse_skill_manifest(text: str, skill_file: Path) -> dict[str, str]:
     """Convert a YAML-like frontmatter block into a manifest dictionary.
 
     Args:
-        lines: Frontmatter lines located between the `---` delimiters.
+        text: Frontmatter text located between the `---` delimiters.
         skill_file: Path to the skill file currently being parsed (used for errors).
 
     Returns:
@@ -39,18 +48,18 @@ def _parse_skill_manifest(lines: list[str], skill_file: Path) -> dict[str, str]:
     """
 
     manifest: dict[str, str] = {}
-    for raw_line in lines:
+    for raw_line in text.splitlines():
         line = raw_line.strip()
         if not line or line.startswith("#"):
             continue
-        if ":" not in line:
+        key, separator, value = line.partition(":")
+        if not separator:
             raise InvalidConfiguration(
                 f"Skill file {skill_file} manifest lines must use 'key: value' syntax."
             )
-        key, value = line.split(":", 1)
         manifest[key.strip()] = _strip_quotes(value)
 
-    for required in ("name", "description"):
+    for required in _REQUIRED_MANIFEST_KEYS:
         if not manifest.get(required):
             raise InvalidConfiguration(
                 f"Skill file {skill_file} must declare '{required}' in the manifest."
@@ -58,6 +67,20 @@ def _parse_skill_manifest(lines: list[str], skill_file: Path) -> dict[str, str]:
     return manifest
 
 
+def _manifest_flag(manifest: dict[str, str], key: str, default: bool, skill_file: Path) -> bool:
+    """Interpret an optional boolean manifest entry such as ``embed_attachments: false``."""
+
+    value = manifest.get(key)
+    if value is None:
+        return default
+    normalized = value.lower()
+    if normalized in {"true", "yes", "1"}:
+        return True
+    if normalized in {"false", "no", "0"}:
+        return False
+    raise InvalidConfiguration(f"Skill file {skill_file} manifest key '{key}' must be true or false.")
+
+
 def _split_skill_file(content: str, skill_file: Path) -> tuple[dict[str, str], str]:
     """Separate a skill file into manifest metadata and instructional text.
 
@@ -73,25 +96,24 @@ def _split_skill_file(content: str, skill_file: Path) -> tuple[dict[str, str], s
     """
 
     text = content.lstrip()
-    lines = text.splitlines()
-    if not lines or lines[0].strip() != "---":
+    # Locate both fences with one regex scan so the (possibly large) body is never
+    # split into lines.
+    opening = _FENCE_RE.match(text)
+    if opening is None:
         raise InvalidConfiguration(
             f"Skill file {skill_file} must begin with a frontmatter block delimited by '---'."
         )
 
-    closing_index = None
-    for index in range(1, len(lines)):
-        if lines[index].strip() == "---":
-            closing_index = index
-            break
-    if closing_index is None:
+    closing = _FENCE_RE.search(text, opening.end())
+    if closing is None:
         raise InvalidConfiguration(
             f"Skill file {skill_file} frontmatter is missing a closing '---' delimiter."
         )
 
-    manifest_lines = lines[1:closing_index]
-    manifest = _parse_skill_manifest(manifest_lines, skill_file)
-    body = "\n".join(lines[closing_index + 1 :]).strip()
+    manifest = _parse_skill_manifest(text[opening.end() : closing.start()], skill_file)
+    body = text[closing.end() :].strip()
+    if "\r" in body:
+        body = "\n".join(body.splitlines())
     if not body:
         raise InvalidConfiguration(f"Skill file {skill_file} must include instructional content after the manifest.")
     return manifest, body
@@ -110,33 +132,22 @@ def load_agent_skills(agent_path: Path) -> list[AgentSkill]:
         InvalidConfiguration: If a skill directory exists without a ``SKILL.md`` file.
     """
 
-    skills_parent = agent_path / "skills"
-    if not skills_parent.is_dir():
+    try:
+        with os.scandir(agent_path / "skills") as entries:
+            # DirEntry.is_dir() reuses the type reported by the directory listing.
+            skill_dirs = sorted(Path(entry.path) for entry in entries if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
     skills: list[AgentSkill] = []
-    for skill_dir in sorted(p for p in skills_parent.iterdir() if p.is_dir()):
+    for skill_dir in skill_dirs:
         skill_file = skill_dir / "SKILL.md"
         try:
-            content = skill_file.read_text(encoding="utf-8")
+            content = read_utf8(skill_file)
         except FileNotFoundError as exc:
             raise InvalidConfiguration(f"Skill directory {skill_dir} is missing SKILL.md.") from exc
 
         manifest, body = _split_skill_file(content, skill_file)
-        attachments: list[AgentSkillAttachment] = []
-        for candidate in sorted(path for path in skill_dir.rglob("*") if path.is_file()):
-            if candidate.name == "SKILL.md":
-                continue
-            rel_path = candidate.relative_to(skill_dir)
-            attachments.append(
-                AgentSkillAttachment(
-                    filename=candidate.name,
-                    relative_path=str(rel_path),
-                    absolute_path=candidate,
-                    size_bytes=candidate.stat().st_size,
-                )
-            )
-
         skills.append(
             AgentSkill(
                 slug=skill_dir.name,
@@ -144,11 +155,58 @@ def load_agent_skills(agent_path: Path) -> list[AgentSkill]:
                 description=manifest["description"],
                 instructions=body,
                 directory=skill_dir,
-                attachments=attachments,
+                embed_attachments=_manifest_flag(manifest, "embed_attachments", True, skill_file),
+                # Attachments are only needed when the skill tool runs; discover them lazily.
+                attachments=None,
             )
         )
 
     return skills
 
 
-__all__ = ["load_agent_skills"]
+def discover_skill_attachments(skill_dir: Path) -> list[AgentSkillAttachment]:
+    """Return every file bundled under ``skill_dir`` other than ``SKILL.md``.
+
+    Args:
+        skill_dir: Directory containing the skill bundle.
+
+    Returns:
+        Attachments sorted by path.
+    """
+
+    found: list[tuple[tuple[str, ...], os.DirEntry[str]]] = []
+    _scan_skill_files(skill_dir, (), found)
+    found.sort(key=lambda item: item[0])
+
+    return [
+        AgentSkillAttachment(
+            filename=entry.name,
+            relative_path=os.path.join(*parts),
+            absolute_path=Path(entry.path),
+            size_bytes=entry.stat().st_size,
+        )
+        for parts, entry in found
+        if entry.name != "SKILL.md"
+    ]
+
+
+def _scan_skill_files(
+    directory: Path | str, prefix: tuple[str, ...], found: list[tuple[tuple[str, ...], os.DirEntry[str]]]
+) -> None:
+    """Collect files beneath ``directory`` with ``os.scandir``, reusing each entry's cached stat.
+
+    Like ``Path.rglob``, symlinked directories are listed but not descended into.
+    Results are keyed on their path components so they sort the way ``Path`` objects do.
+    """
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            parts = (*prefix, entry.name)
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    _scan_skill_files(entry.path, parts, found)
+            elif entry.is_file():
+                found.append((parts, entry))
+
+
+__all__ = ["discover_skill_attachments", "load_agent_skills"]
@@ -2,66 +2,107 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import re
+from dataclasses import InitVar, dataclass, field
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal, Sequence
+from urllib.parse import quote
 
-from agents import function_tool
-from agents.tool import FunctionTool
-from pydantic import BaseModel, Field
+from . import _json
+from ._text import read_utf8
 
+if TYPE_CHECKING:  # pragma: no cover - the Agents SDK loads lazily when tools are built
+    from agents.tool import FunctionTool
 
-class AgentSkillAttachment(BaseModel):
+#: Attachments up to this size keep their text in memory after the first read.
+_ATTACHMENT_CACHE_LIMIT = 256 * 1024
+#: URI scheme under which the MCP server exposes skill attachments as resources.
+SKILL_RESOURCE_SCHEME = "skill"
+_TOOL_NAME_RE = re.compile(r"[^A-Za-z0-9_-]")
+
+
+@dataclass(frozen=True, slots=True)
+class AgentSkillAttachment:
     """Metadata describing optional files bundled with a skill."""
 
     filename: str
     relative_path: str
     absolute_path: Path
     size_bytes: int
+    _cached_text: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def read_text(self) -> str:
-        """Return the attachment contents, assuming UTF-8 text."""
+        """Return the attachment contents, assuming UTF-8 text.
+
+        Small attachments are read from disk once and served from memory afterwards.
+        """
 
-        return self.absolute_path.read_text(encoding="utf-8")
+        if self._cached_text is not None:
+            return self._cached_text
+        text = read_utf8(self.absolute_path)
+        if self.size_bytes <= _ATTACHMENT_CACHE_LIMIT:
+            object.__setattr__(self, "_cached_text", text)
+        return text
 
 
-class AgentSkill(BaseModel):
-    """Runtime representation of an agent skill and its assets."""
+@dataclass(frozen=True, slots=True)
+class AgentSkill:
+    """Runtime representation of an agent skill and its assets.
+
+    Passing ``attachments=None`` defers scanning ``directory`` for attachments until they
+    are first needed.
+    """
 
     slug: str
     name: str
     description: str
     instructions: str
     directory: Path
-    attachments: list[AgentSkillAttachment] = Field(default_factory=list)
-
-    @property
-    def tool_name(self) -> str:
-        """Return a sanitized function tool name derived from the slug."""
-
-        sanitized = re.sub(r"[^A-Za-z0-9_-]", "_", self.slug).strip("_") or "skill"
-        return f"skill_{sanitized}" if not sanitized.startswith("skill_") else sanitized
+    #: Attachments given at construction; ``None`` means "discover under ``directory``".
+    attachments: InitVar[Sequence[AgentSkillAttachment] | None] = ()
+    #: When false, ``intent='full'`` lists attachment resource URIs instead of their text.
+    embed_attachments: bool = True
+    #: Sanitized function tool name derived from the slug.
+    tool_name: str = field(init=False, compare=False)
+    _attachments: tuple[AgentSkillAttachment, ...] | None = field(init=False, repr=False, compare=False)
+    _preview: tuple[dict[str, object], str] | None = field(init=False, repr=False, compare=False)
+    _preview_excerpts: dict[int, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self, attachments: Sequence[AgentSkillAttachment] | None) -> None:
+        sanitized = _TOOL_NAME_RE.sub("_", self.slug).strip("_") or "skill"
+        tool_name = f"skill_{sanitized}" if not sanitized.startswith("skill_") else sanitized
+        object.__setattr__(self, "tool_name", tool_name)
+        object.__setattr__(self, "_attachments", None if attachments is None else tuple(attachments))
+        object.__setattr__(self, "_preview", None)
+        object.__setattr__(self, "_preview_excerpts", {})
+
+    def resolve_attachments(self) -> tuple[AgentSkillAttachment, ...]:
+        """Return the skill's attachments, scanning ``directory`` on first use if needed."""
+
+        attachments = self._attachments
+        if attachments is None:
+            from .skill_loader import discover_skill_attachments
+
+            attachments = tuple(discover_skill_attachments(self.directory))
+            object.__setattr__(self, "_attachments", attachments)
+        return attachments
 
     def preview_excerpt(self, limit: int = 500) -> str:
         """Return a trimmed preview of the instructions for lightweight calls."""
 
-        text = self.instructions.strip()
-        if len(text) <= limit:
-            return text
-        return text[: limit - 3].rstrip() + "..."
-
-    def build_tool(self) -> FunctionTool:
-        """Create a function tool that exposes this skill to the agent loop."""
+        excerpt = self._preview_excerpts.get(limit)
+        if excerpt is None:
+            text = self.instructions.strip()
+            excerpt = text if len(text) <= limit else text[: limit - 3].rstrip() + "..."
+            self._preview_excerpts[limit] = excerpt
+        return excerpt
 
-        description = f"{self.description} (skill: {self.name})"
+    def _preview_payload(self) -> tuple[dict[str, object], str]:
+        """Return the ``intent='preview'`` payload and its serialized form, built once."""
 
-        @function_tool(name_override=self.tool_name, description_override=description)
-        def use_skill(intent: Literal["preview", "full"] = "preview") -> str:
-            if intent not in {"preview", "full"}:
-                raise ValueError("intent must be 'preview' or 'full'.")
-
-            include_full = intent == "full"
+        preview = self._preview
+        if preview is None:
             payload: dict[str, object] = {
                 "skill": {
                     "slug": self.slug,
@@ -74,24 +115,103 @@ class AgentSkill(BaseModel):
                         "filename": attachment.filename,
                         "relative_path": attachment.relative_path,
                         "size_bytes": attachment.size_bytes,
-                        "available_via": "intent='full'",
+                        "available_via": (
+                            "intent='full'" if self.embed_attachments else f"attachment={attachment.relative_path!r}"
+                        ),
                     }
-                    for attachment in self.attachments
+                    for attachment in self.resolve_attachments()
                 ],
             }
-
-            if include_full:
-                payload["instructions"] = self.instructions
-                if self.attachments:
-                    payload["attachment_contents"] = {
-                        attachment.relative_path: attachment.read_text() for attachment in self.attachments
+            preview = (payload, _json.dumps_pretty(payload))
+            object.__setattr__(self, "_preview", preview)
+        return preview
+
+    def _render_full_payload(self, agent_id: str | None) -> str:
+        """Serialize the ``intent='full'`` payload, reading attachments if they are embedded."""
+
+        payload = {**self._preview_payload()[0], "instructions": self.instructions}
+        attachments = self.resolve_attachments()
+        if attachments:
+            if self.embed_attachments or agent_id is None:
+                payload["attachment_contents"] = {
+                    attachment.relative_path: attachment.read_text() for attachment in attachments
+                }
+            else:
+                payload["attachment_contents"] = {
+                    attachment.relative_path: {
+                        "uri": self.resource_uri(agent_id, attachment),
+                        "size_bytes": attachment.size_bytes,
+                        "available_via": f"attachment={attachment.relative_path!r}",
                     }
+                    for attachment in self.resolve_attachments()
+                }
+        return _json.dumps_pretty(payload)
+
+    def read_attachment(self, relative_path: str) -> str:
+        """Return the text of the attachment stored at ``relative_path`` within the skill.
+
+        Raises:
+            ValueError: If the skill has no attachment at ``relative_path``.
+        """
+
+        for attachment in self.resolve_attachments():
+            if attachment.relative_path == relative_path:
+                return attachment.read_text()
+        raise ValueError(f"Skill '{self.slug}' has no attachment '{relative_path}'.")
 
-            return json.dumps(payload, indent=2)
+    def resource_uri(self, agent_id: str, attachment: AgentSkillAttachment) -> str:
+        """Return the MCP resource URI under which ``attachment`` is served for ``agent_id``."""
+
+        return (
+            f"{SKILL_RESOURCE_SCHEME}://{quote(agent_id, safe='')}/{quote(self.slug, safe='')}/"
+            f"{quote(attachment.relative_path)}"
+        )
+
+    def build_tool(self, agent_id: str | None = None) -> FunctionTool:
+        """Create a function tool that exposes this skill to the agent loop.
+
+        Args:
+            agent_id: Agent that owns the skill. Required to reference attachments by
+                resource URI when ``embed_attachments`` is false; without it attachment
+                text is always embedded. Either way the tool's ``attachment`` argument
+                returns the text of a single attachment.
+        """
+
+        from agents import function_tool
+
+        description = f"{self.description} (skill: {self.name})"
+
+        @function_tool(name_override=self.tool_name, description_override=description)
+        async def use_skill(intent: Literal["preview", "full"] = "preview", attachment: str | None = None) -> str:
+            """Read the skill.
+
+            Args:
+                intent: 'preview' for a summary, 'full' for the complete instructions.
+                attachment: Relative path of one attachment whose text should be returned.
+            """
+
+            if intent not in {"preview", "full"}:
+                raise ValueError("intent must be 'preview' or 'full'.")
+
+            if attachment is not None:
+                return await asyncio.to_thread(self.read_attachment, attachment)
+
+            if intent == "preview":
+                return self._preview_payload()[1]
+            if self.resolve_attachments() and (self.embed_attachments or agent_id is None):
+                # Reading and encoding attachment text would stall the event loop.
+                return await asyncio.to_thread(self._render_full_payload, agent_id)
+            return self._render_full_payload(agent_id)
 
         return use_skill
 
 
+# ``attachments`` is the init-only argument above; read access goes through the same lazy
+# lookup. Installed after the class body so the dataclass does not take the property for
+# the argument's default.
+AgentSkill.attachments = property(AgentSkill.resolve_attachments)  # type: ignore[attr-defined]
+
+
 def render_skill_section(skills: list[AgentSkill]) -> str:
     """Render an instructional section summarizing available skills."""
 
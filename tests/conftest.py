@@ -6,6 +6,10 @@ from typing import Generator
 
 import pytest
 
+from codex_sub_agent._config_cache import clear_loaded_configs
+from codex_sub_agent.config_loader import load_config
+from codex_sub_agent.config_models import SubAgentConfig
+
 
 @pytest.fixture(scope="session")
 def sample_config_dir(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
@@ -19,3 +23,37 @@ def sample_config_dir(tmp_path_factory: pytest.TempPathFactory) -> Generator[Pat
     shutil.copytree(package_root, dest)
 
     yield dest
+
+
+@pytest.fixture(scope="session")
+def minimal_config(tmp_path_factory: pytest.TempPathFactory) -> SubAgentConfig:
+    """Load a configuration without agents once per session; tests must treat it as read-only."""
+
+    config_path = tmp_path_factory.mktemp("minimal_config") / "codex_sub_agents.toml"
+    config_path.write_text(
+        """
+agent_files = []
+
+[mcp_servers.codex]
+type = "stdio"
+name = "Codex CLI"
+command = "npx"
+client_session_timeout_seconds = 60
+""",
+        encoding="utf-8",
+    )
+    # Session fixtures run before the per-test cache isolation, so bypass the cache here.
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("CODEX_SUB_AGENT_CONFIG_NOCACHE", "1")
+        return load_config(config_path)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep on-disk caches out of the real user cache directory and reset in-process memos."""
+
+    cache_home = tmp_path_factory.mktemp("cache_home")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    monkeypatch.delenv("CODEX_SUB_AGENT_CONFIG_NOCACHE", raising=False)
+    clear_loaded_configs()
+    return cache_home
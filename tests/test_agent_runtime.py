@@ -1,7 +1,16 @@
 """Unit tests for the agent_runtime helpers."""
 
+import pytest
+
 from codex_sub_agent.agent_runtime import AgentRegistry
-from codex_sub_agent.config_models import AgentSettings, MCPStdioConfig, OpenAISettings, SubAgentConfig
+from codex_sub_agent.config_models import (
+    AgentSettings,
+    InvalidConfiguration,
+    MCPStdioConfig,
+    OpenAISettings,
+    SubAgentConfig,
+)
+from codex_sub_agent.skills import AgentSkill
 
 
 def _make_config() -> SubAgentConfig:
@@ -22,6 +31,12 @@ def _make_config() -> SubAgentConfig:
     )
 
 
+def _with_skill(config: SubAgentConfig, skill: AgentSkill) -> SubAgentConfig:
+    agent = config.agents["demo"]
+    agent = agent.model_copy(update={"skills": [*agent.skills, skill]})
+    return config.model_copy(update={"agents": {**config.agents, "demo": agent}})
+
+
 def test_agent_registry_exposes_tool_metadata() -> None:
     """Registry should sanitize alias names into valid tool identifiers."""
 
@@ -45,3 +60,92 @@ def test_agent_registry_lists_summaries() -> None:
     assert agent_id == "demo"
     assert settings.name == "Demo Agent"
     assert aliases == ["csa:demo"]
+
+
+def test_agent_registry_suffixes_colliding_tool_names() -> None:
+    """Aliases that sanitize to the same name receive incrementing suffixes."""
+
+    config = _make_config().model_copy(update={"aliases": {"csa:demo": "demo", "csa/demo": "demo", "csa demo": "demo"}})
+    registry = AgentRegistry(config)
+
+    assert sorted(registry.tool_entries) == ["csa_demo", "csa_demo_2", "csa_demo_3"]
+
+
+def test_agent_registry_fallback_tool_names_are_unique() -> None:
+    """Unaliased agents get distinct fallback tool names even when their ids sanitize alike."""
+
+    base = _make_config()
+    demo = base.agents["demo"]
+    config = base.model_copy(update={"agents": {"demo": demo, "x.": demo, "x/": demo, "x_2": demo}})
+    registry = AgentRegistry(config)
+
+    # Fallbacks are registered up front, so cli_aliases is complete before any lookup.
+    assert {"x.", "x/", "x_2"} <= set(registry.cli_aliases)
+    entries = [registry.resolve_cli_alias(agent_id) for agent_id in ("x.", "x/", "x_2")]
+    assert len({entry.tool_name for entry in entries}) == 3
+    assert all(registry.cli_aliases[entry.tool_name] is entry for entry in entries)
+
+
+def test_resolve_cli_alias_error_lists_each_alias_once() -> None:
+    """Unknown aliases report the available aliases without duplicate tool names."""
+
+    registry = AgentRegistry(_make_config())
+
+    with pytest.raises(InvalidConfiguration, match=r"Available: csa:demo, demo$"):
+        registry.resolve_cli_alias("missing")
+
+
+def test_make_tool_name_bounds_length() -> None:
+    """Long aliases are truncated to 64 characters while staying distinct."""
+
+    used: set[str] = set()
+    next_index: dict[str, int] = {}
+    first = AgentRegistry._make_tool_name("a" * 80, used, next_index)
+    used.add(first)
+    second = AgentRegistry._make_tool_name("a" * 80, used, next_index)
+    other = AgentRegistry._make_tool_name("a" * 79 + "b", used, next_index)
+
+    assert len(first) == len(second) == len(other) == 64
+    assert len({first, second, other}) == 3
+
+
+def test_agent_registry_exposes_skill_attachments_as_resources(tmp_path) -> None:
+    """Skill attachments are listed as resources and resolved by the URI the skill reports."""
+
+    attachment_path = tmp_path / "deep_focus" / "notes" / "guide.md"
+    attachment_path.parent.mkdir(parents=True)
+    attachment_path.write_text("Long-form guidance.", encoding="utf-8")
+    skill = AgentSkill(
+        slug="deep_focus",
+        name="Deep Focus",
+        description="Stay on task",
+        instructions="Plan first.",
+        directory=attachment_path.parent.parent,
+        attachments=None,
+        embed_attachments=False,
+    )
+    config = _with_skill(_make_config(), skill)
+    registry = AgentRegistry(config)
+
+    (resource,) = registry.resource_definitions
+    uri = skill.resource_uri("demo", skill.attachments[0])
+    assert str(resource.uri) == uri == "skill://demo/deep_focus/notes/guide.md"
+    assert registry.resolve_skill_resource(uri).read_text() == "Long-form guidance."
+    with pytest.raises(InvalidConfiguration):
+        registry.resolve_skill_resource("skill://demo/deep_focus/missing.md")
+
+
+def test_blueprint_skill_tools_are_built_once(tmp_path) -> None:
+    skill = AgentSkill(
+        slug="deep_focus",
+        name="Deep Focus",
+        description="Stay on task",
+        instructions="Plan first.",
+        directory=tmp_path,
+    )
+    config = _with_skill(_make_config(), skill)
+    blueprint = AgentRegistry(config).resolve_cli_alias("csa:demo").blueprint
+
+    tools = blueprint.skill_tools()
+    assert [tool.name for tool in tools] == ["skill_deep_focus"]
+    assert blueprint.skill_tools() is tools
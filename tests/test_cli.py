@@ -10,6 +10,7 @@ import pytest
 from codex_sub_agent import cli
 from codex_sub_agent.agent_runtime import AgentBlueprint
 from codex_sub_agent.config_loader import load_config
+from codex_sub_agent.config_models import SubAgentConfig
 
 
 def _write(path: Path, content: str) -> None:
@@ -122,6 +123,19 @@ def test_configure_is_idempotent(sample_config_dir: Path, tmp_path: Path, capsys
     assert "already contains the codex_sub_agent stanza" in captured.out
 
 
+def test_configure_reports_missing_config(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """configure should fail without touching the Codex config when the file is absent."""
+
+    codex_config = tmp_path / ".codex" / "config.toml"
+    exit_code = cli.main(
+        ["configure", "--config", str(tmp_path / "missing.toml"), "--codex-config", str(codex_config)]
+    )
+
+    assert exit_code == 1
+    assert not codex_config.exists()
+    assert "Configuration file not found" in capsys.readouterr().err
+
+
 def test_run_agent_flag_invokes_alias(sample_config_dir: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
     """--run-agent executes a single agent using the shared workflow helper."""
 
@@ -152,59 +166,35 @@ def test_run_agent_flag_invokes_alias(sample_config_dir: Path, monkeypatch: pyte
     assert "csa:test-agent|Focus on docs" in output
 
 
-def test_envrc_in_current_directory_supplies_missing_key(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_envrc_in_current_directory_supplies_missing_key(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, minimal_config: SubAgentConfig
+) -> None:
     """When OPENAI_API_KEY is missing, direnv-provided values fill it in."""
 
     envrc = tmp_path / ".envrc"
     envrc.write_text('export OPENAI_API_KEY="from-envrc"\n', encoding="utf-8")
-    config_path = tmp_path / "config" / "codex_sub_agents.toml"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(
-        """
-agent_files = []
-
-[mcp_servers.codex]
-type = "stdio"
-name = "Codex CLI"
-command = "npx"
-client_session_timeout_seconds = 60
-""",
-        encoding="utf-8",
-    )
 
     monkeypatch.chdir(tmp_path)
     monkeypatch.delenv("OPENAI_API_KEY", raising=False)
     monkeypatch.setattr(cli, "_load_env_from_direnv", lambda _: {"OPENAI_API_KEY": "from-envrc"})
 
-    cli._populate_env_from_envrc(load_config(config_path))
+    cli._populate_env_from_envrc(minimal_config)
     assert os.environ["OPENAI_API_KEY"] == "from-envrc"
 
 
-def test_envrc_does_not_override_existing_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_envrc_does_not_override_existing_env(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, minimal_config: SubAgentConfig
+) -> None:
     """If OPENAI_API_KEY is already set, .envrc is ignored."""
 
     envrc = tmp_path / ".envrc"
     envrc.write_text('export OPENAI_API_KEY="from-envrc"\n', encoding="utf-8")
-    config_path = tmp_path / "config" / "codex_sub_agents.toml"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(
-        """
-agent_files = []
-
-[mcp_servers.codex]
-type = "stdio"
-name = "Codex CLI"
-command = "npx"
-client_session_timeout_seconds = 60
-""",
-        encoding="utf-8",
-    )
 
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("OPENAI_API_KEY", "preexisting")
     monkeypatch.setattr(cli, "_load_env_from_direnv", lambda _: {"OPENAI_API_KEY": "from-envrc"})
 
-    cli._populate_env_from_envrc(load_config(config_path))
+    cli._populate_env_from_envrc(minimal_config)
     assert os.environ["OPENAI_API_KEY"] == "preexisting"
 
 
@@ -0,0 +1,56 @@
+"""Tests for the Codex MCP stdout filter."""
+
+import io
+
+from codex_sub_agent.codex_mcp_wrapper import _filter_stream
+
+
+class _TricklingPipe(io.RawIOBase):
+    """Raw stream that returns at most ``chunk`` bytes per read, like a busy pipe."""
+
+    def __init__(self, data: bytes, chunk: int) -> None:
+        self._data = data
+        self._chunk = chunk
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = min(self._chunk, len(buffer), len(self._data))
+        buffer[:count] = self._data[:count]
+        self._data = self._data[count:]
+        return count
+
+
+def test_filter_stream_drops_codex_events_across_chunk_boundaries() -> None:
+    """Frames split across reads are reassembled; only codex/event notifications are dropped."""
+
+    stream = (
+        b'{"jsonrpc":"2.0","id":1,"result":{}}\n'
+        b"\n"
+        b'{"jsonrpc":"2.0","method":"codex/event","params":{"msg":"ignored"}}\n'
+        b"not json\n"
+        b'{"jsonrpc":"2.0","method":"notifications/progress"}'
+    )
+    # Tiny reads force every frame to straddle several chunks.
+    source = io.BufferedReader(_TricklingPipe(stream, chunk=7))
+    sink = io.BytesIO()
+
+    _filter_stream(source, sink)
+
+    assert sink.getvalue() == (
+        b'{"jsonrpc":"2.0","id":1,"result":{}}\n'
+        b"not json\n"
+        b'{"jsonrpc":"2.0","method":"notifications/progress"}'
+    )
+
+
+def test_filter_stream_keeps_frames_that_only_mention_codex_events() -> None:
+    """The substring fast path must not drop frames that merely contain the event name."""
+
+    stream = b'{"jsonrpc":"2.0","id":2,"result":{"text":"method codex/event"}}\n'
+    sink = io.BytesIO()
+
+    _filter_stream(io.BufferedReader(io.BytesIO(stream)), sink)
+
+    assert sink.getvalue() == stream
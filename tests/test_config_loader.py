@@ -1,7 +1,13 @@
 """Tests for loading agent configurations from multi-file directories."""
 
+import os
+import time
 from pathlib import Path
 
+import pytest
+
+from codex_sub_agent import _config_cache, config_loader
+from codex_sub_agent._config_cache import clear_loaded_configs
 from codex_sub_agent.config_loader import load_config
 
 
@@ -118,3 +124,120 @@ Always brainstorm before coding and confirm the plan with the user.
 
     assert "## Available Skills" in agent.instructions
     assert "Deep Focus" in agent.instructions
+
+
+def _age_tree(root: Path, seconds: float) -> None:
+    """Backdate every file and directory under ``root`` past the cache's racy window."""
+
+    stamp = time.time() - seconds
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, (stamp, stamp))
+
+
+def test_load_config_reuses_cache_until_inputs_change(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A second load is served from the on-disk cache; editing an agent file invalidates it."""
+
+    config_root = tmp_path / "config"
+    agent_dir = config_root / "agents" / "demo"
+    _write_file(agent_dir / "agent.toml", 'id = "demo"\n\n[agent]\nname = "Demo Agent"\n')
+    _write_file(agent_dir / "instructions.md", "Primary instructions.")
+    _write_file(agent_dir / "default_prompt.md", "Kick things off.")
+    config_path = config_root / "codex_sub_agents.toml"
+    _write_file(
+        config_path,
+        """
+        agent_files = ["agents/demo"]
+
+        [mcp_servers.codex]
+        type = "stdio"
+        name = "Codex CLI"
+        command = "npx"
+        """,
+    )
+    _age_tree(config_root, 60)
+
+    first = load_config(config_path)
+
+    def fail_parse(_path):
+        raise AssertionError("expected a cache hit")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(config_loader._toml, "load_path", fail_parse)
+        assert load_config(config_path) is first
+        # A fresh process has nothing in memory and falls back to the on-disk cache.
+        clear_loaded_configs()
+        cached = load_config(config_path)
+    assert cached is not first
+    assert cached.model_dump() == first.model_dump()
+
+    (agent_dir / "instructions.md").write_text("Updated instructions.", encoding="utf-8")
+    _age_tree(config_root, 30)
+    reloaded = load_config(config_path)
+    assert reloaded.available_agents()["demo"].instructions == "Updated instructions."
+
+
+def test_load_config_ignores_cache_from_another_release(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Cache entries are keyed on the package version, so upgrades never reuse old pickles."""
+
+    config_path = tmp_path / "codex_sub_agents.toml"
+    _write_file(
+        config_path,
+        """
+        agent_files = []
+
+        [mcp_servers.codex]
+        type = "stdio"
+        name = "Codex CLI"
+        command = "npx"
+        """,
+    )
+    _age_tree(tmp_path, 60)
+    load_config(config_path)
+    clear_loaded_configs()
+
+    parsed: list[Path] = []
+    real_load_path = config_loader._toml.load_path
+
+    def counting_load_path(path: Path):
+        parsed.append(path)
+        return real_load_path(path)
+
+    monkeypatch.setattr(config_loader._toml, "load_path", counting_load_path)
+    monkeypatch.setattr(_config_cache, "__version__", "999.0.0")
+    _config_cache._cache_build.cache_clear()
+    try:
+        load_config(config_path)
+    finally:
+        _config_cache._cache_build.cache_clear()
+    assert parsed == [config_path]
+
+
+def test_load_config_ignores_cache_files_others_can_write(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A cache entry writable by other users is never unpickled."""
+
+    config_path = tmp_path / "codex_sub_agents.toml"
+    _write_file(
+        config_path,
+        """
+        agent_files = []
+
+        [mcp_servers.codex]
+        type = "stdio"
+        name = "Codex CLI"
+        command = "npx"
+        """,
+    )
+    _age_tree(tmp_path, 60)
+    load_config(config_path)
+    clear_loaded_configs()
+
+    cache_file = _config_cache._cache_file(config_path)
+    assert cache_file is not None
+    assert cache_file.parent.stat().st_mode & 0o777 == 0o700
+    cache_file.chmod(0o666)
+
+    unpickled: list[object] = []
+    monkeypatch.setattr(_config_cache.pickle, "load", lambda *args, **kwargs: unpickled.append(args))
+    monkeypatch.setattr(_config_cache.pickle, "loads", lambda *args, **kwargs: unpickled.append(args))
+    load_config(config_path)
+    assert unpickled == []
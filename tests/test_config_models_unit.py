@@ -1,10 +1,13 @@
 """Unit tests for config_models module."""
 
+import pickle
+
 import pytest
 
 from codex_sub_agent.config_models import (
     AgentSettings,
     InvalidConfiguration,
+    MCPHttpConfig,
     MCPStdioConfig,
     OpenAISettings,
     SubAgentConfig,
@@ -45,3 +48,78 @@ def test_available_agents_requires_entries() -> None:
 
     with pytest.raises(InvalidConfiguration):
         config.available_agents()
+
+
+def test_resolve_agent_without_default_picks_lowest_id() -> None:
+    config = SubAgentConfig(
+        openai=OpenAISettings(),
+        agents={"zeta": _base_agent(), "alpha": _base_agent()},
+        mcp_servers={"codex": MCPStdioConfig(type="stdio", name="Codex", command="echo")},
+    )
+
+    assert config.resolve_agent(None)[0] == "alpha"
+    config = config.model_copy(update={"agents": {"beta": _base_agent()}})
+    assert config.resolve_agent(None)[0] == "beta"
+
+
+def test_available_agents_is_read_only_and_survives_pickling() -> None:
+    config = SubAgentConfig(
+        openai=OpenAISettings(),
+        agents={"demo": _base_agent()},
+        mcp_servers={"codex": MCPStdioConfig(type="stdio", name="Codex", command="echo")},
+    )
+
+    agents = config.available_agents()
+    with pytest.raises(TypeError):
+        agents["other"] = _base_agent()  # type: ignore[index]
+
+    restored = pickle.loads(pickle.dumps(config))
+    assert list(restored.available_agents()) == ["demo"]
+
+
+def test_http_request_headers_are_built_per_call_and_not_pickled() -> None:
+    config = MCPHttpConfig(type="http", name="HTTP", url="https://example.com", headers={"X-Team": "core"})
+
+    headers = config.request_headers("secret")
+    assert headers == {"X-Team": "core", "Authorization": "Bearer secret"}
+    headers["X-Team"] = "mutated"
+    assert config.request_headers("secret")["X-Team"] == "core"
+    assert config.request_headers("rotated")["Authorization"] == "Bearer rotated"
+    assert config.headers == {"X-Team": "core"}
+    assert b"rotated" not in pickle.dumps(config)
+
+
+def test_configuration_models_are_frozen() -> None:
+    config = SubAgentConfig(openai=OpenAISettings(), agents={"demo": _base_agent()})
+
+    with pytest.raises(ValueError, match="frozen"):
+        config.aliases = {"demo": "demo"}  # type: ignore[misc]
+    with pytest.raises(ValueError, match="frozen"):
+        config.agents["demo"].name = "Renamed"  # type: ignore[misc]
+
+
+def test_agent_settings_validates_skills_from_plain_dicts(tmp_path) -> None:
+    settings = AgentSettings.model_validate(
+        {
+            "name": "Demo",
+            "instructions": "Instruction",
+            "default_prompt": "Prompt",
+            "skills": [
+                {
+                    "slug": "deep focus",
+                    "name": "Deep Focus",
+                    "description": "Stay on target.",
+                    "instructions": "Focus.",
+                    "directory": str(tmp_path),
+                }
+            ],
+        }
+    )
+
+    skill = settings.skills[0]
+    assert skill.tool_name == "skill_deep_focus"
+    assert skill.attachments == ()
+    assert skill.preview_excerpt() == "Focus."
+    dumped = settings.model_dump()["skills"][0]
+    assert not [key for key in dumped if key.startswith("_")]
+    assert "tool_name" not in dumped
@@ -1,13 +1,15 @@
 """Tests for MCP server utilities."""
 
 import asyncio
+import json
 import types
+from pathlib import Path
 
 import pytest
 
 from codex_sub_agent.agent_runtime import AgentAliasEntry, AgentBlueprint
-from codex_sub_agent.config_models import AgentSettings, MCPHttpConfig, MCPStdioConfig, OpenAISettings, SubAgentConfig
-from codex_sub_agent.mcp_server import format_run_result, initialize_mcp_servers, run_agent_workflow
+from codex_sub_agent.config_models import AgentSettings, InvalidConfiguration, MCPHttpConfig, MCPStdioConfig, OpenAISettings, SubAgentConfig
+from codex_sub_agent.mcp_server import MCPServerPool, format_run_result, initialize_mcp_servers, run_agent_workflow
 
 
 def _agent_settings() -> AgentSettings:
@@ -33,6 +35,17 @@ def test_format_run_result_handles_missing_output() -> None:
     assert "Helper" in text
 
 
+def test_format_run_result_serializes_structured_output() -> None:
+    blueprint = AgentBlueprint(agent_id="demo", settings=_agent_settings(), mcp_server_names=[])
+    alias_entry = AgentAliasEntry(alias="demo", tool_name="demo", blueprint=blueprint, description="")
+
+    result = types.SimpleNamespace(final_output={"path": Path("out.txt"), "count": 2}, last_agent=None)
+
+    text = format_run_result(alias_entry, result)
+    assert json.loads(text) == {"path": "out.txt", "count": 2}
+    assert text.startswith('{\n  "')
+
+
 def test_initialize_mcp_servers_starts_stdio(monkeypatch: pytest.MonkeyPatch) -> None:
     created: list[dict] = []
 
@@ -61,10 +74,87 @@ def test_initialize_mcp_servers_starts_stdio(monkeypatch: pytest.MonkeyPatch) ->
         },
     )
 
-    servers, stack = asyncio.run(initialize_mcp_servers(config, ["codex", "http"]))
+    servers, teardown = asyncio.run(initialize_mcp_servers(config, ["codex", "http"]))
     assert set(servers) == {"codex", "http"}
     assert len(created) == 2
-    asyncio.run(stack.aclose())
+    asyncio.run(teardown())
+
+
+def test_stdio_command_is_resolved_when_the_server_is_built(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """The configured command stays as written and is looked up on the server's own PATH."""
+
+    executable = tmp_path / "demo-mcp"
+    executable.write_text("#!/bin/sh\n", encoding="utf-8")
+    executable.chmod(0o755)
+    commands: list[str] = []
+    started: list[str] = []
+
+    class DummyServer:
+        def __init__(self, params, name, client_session_timeout_seconds):
+            commands.append(params["command"])
+
+        async def __aenter__(self):
+            started.append("demo")
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+    monkeypatch.setattr("codex_sub_agent.mcp_server.MCPServerStdio", DummyServer)
+    env = {"PATH": str(tmp_path)}
+    config = SubAgentConfig(
+        openai=OpenAISettings(),
+        agents={"demo": _agent_settings()},
+        mcp_servers={
+            "demo": MCPStdioConfig(type="stdio", name="Demo", command="demo-mcp", env=env),
+            "missing": MCPStdioConfig(type="stdio", name="Missing", command="no-such-mcp-server", env=env),
+        },
+    )
+    assert config.mcp_servers["demo"].command == "demo-mcp"
+
+    for _ in range(2):
+        _, teardown = asyncio.run(initialize_mcp_servers(config, ["demo"]))
+        asyncio.run(teardown())
+    assert commands == [str(executable)] * 2
+
+    # Missing commands are configuration errors, raised before any server is started.
+    with pytest.raises(InvalidConfiguration, match="no-such-mcp-server"):
+        asyncio.run(initialize_mcp_servers(config, ["demo", "missing"]))
+    assert len(started) == 2
+
+
+def test_initialize_mcp_servers_closes_started_servers_on_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[str] = []
+
+    class DummyServer:
+        def __init__(self, params, name, client_session_timeout_seconds):
+            self.name = name
+
+        async def __aenter__(self):
+            if self.name == "HTTP":
+                raise ConnectionError("handshake failed")
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            closed.append(self.name)
+            return False
+
+    monkeypatch.setattr("codex_sub_agent.mcp_server.MCPServerStdio", DummyServer)
+    monkeypatch.setattr("codex_sub_agent.mcp_server.MCPServerStreamableHttp", DummyServer)
+
+    config = SubAgentConfig(
+        openai=OpenAISettings(),
+        agents={"demo": _agent_settings()},
+        aliases={"demo": "demo"},
+        mcp_servers={
+            "codex": MCPStdioConfig(type="stdio", name="Codex", command="echo"),
+            "http": MCPHttpConfig(type="http", name="HTTP", url="https://example.com"),
+        },
+    )
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(initialize_mcp_servers(config, ["codex", "http"]))
+    assert closed == ["Codex"]
 
 
 def test_run_agent_workflow_invokes_runner(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -101,3 +191,86 @@ def test_run_agent_workflow_invokes_runner(monkeypatch: pytest.MonkeyPatch) -> N
     result = asyncio.run(run_agent_workflow(entry, config, requested_prompt="Override"))
     assert result == "done"
     assert calls and calls[0][1] == "Override"
+
+
+def test_run_agent_workflow_skips_server_startup_without_mcp_servers(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fail_initialize(*_args, **_kwargs):
+        raise AssertionError("initialize_mcp_servers should not run for tool-less agents")
+
+    async def fake_run(agent, entry_message):
+        return agent.mcp_servers
+
+    monkeypatch.setattr("codex_sub_agent.mcp_server.initialize_mcp_servers", fail_initialize)
+    monkeypatch.setattr("codex_sub_agent.mcp_server.Runner.run", staticmethod(fake_run))
+
+    settings = _agent_settings()
+    config = SubAgentConfig(
+        openai=OpenAISettings(),
+        agents={"demo": settings},
+        aliases={"demo": "demo"},
+        mcp_servers={"codex": MCPStdioConfig(type="stdio", name="Codex", command="echo")},
+    )
+    blueprint = AgentBlueprint(agent_id="demo", settings=settings, mcp_server_names=())
+    entry = AgentAliasEntry(alias="demo", tool_name="demo", blueprint=blueprint, description="")
+
+    assert asyncio.run(run_agent_workflow(entry, config, requested_prompt=None)) == []
+
+
+def test_server_pool_reuses_servers_across_runs_and_restarts_after_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[str] = []
+
+    class DummyServer:
+        async def __aenter__(self):
+            events.append("start")
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            events.append("stop")
+            return False
+
+    outcomes = ["done", RuntimeError("session broke"), "done"]
+
+    async def fake_run(agent, entry_message):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setenv("OPENAI_API_KEY", "key")
+    monkeypatch.setattr("codex_sub_agent.mcp_server.MCPServerStdio", lambda **_: DummyServer())
+    monkeypatch.setattr("codex_sub_agent.mcp_server.Runner.run", staticmethod(fake_run))
+
+    settings = _agent_settings().model_copy(update={"mcp_servers": ["codex"]})
+    config = SubAgentConfig(
+        openai=OpenAISettings(),
+        agents={"demo": settings},
+        aliases={"demo": "demo"},
+        mcp_servers={"codex": MCPStdioConfig(type="stdio", name="Codex", command="echo")},
+    )
+    blueprint = AgentBlueprint(agent_id="demo", settings=settings, mcp_server_names=["codex"])
+    entry = AgentAliasEntry(alias="demo", tool_name="demo", blueprint=blueprint, description="")
+
+    async def scenario() -> None:
+        pool = MCPServerPool(config)
+        assert await run_agent_workflow(entry, config, None, server_pool=pool) == "done"
+        with pytest.raises(RuntimeError):
+            await run_agent_workflow(entry, config, None, server_pool=pool)
+        assert await run_agent_workflow(entry, config, None, server_pool=pool) == "done"
+        await pool.aclose()
+
+    asyncio.run(scenario())
+    # Started once for the first two runs, discarded after the failure, restarted for the third.
+    assert events == ["start", "stop", "start", "stop"]
+
+
+def test_initialize_mcp_servers_without_names_starts_nothing() -> None:
+    config = SubAgentConfig(
+        openai=OpenAISettings(),
+        agents={"demo": _agent_settings()},
+        aliases={"demo": "demo"},
+        mcp_servers={"codex": MCPStdioConfig(type="stdio", name="Codex", command="echo")},
+    )
+
+    servers, teardown = asyncio.run(initialize_mcp_servers(config, []))
+    assert servers == {}
+    asyncio.run(teardown())
@@ -41,3 +41,79 @@ def test_load_agent_skills_requires_frontmatter(tmp_path: Path) -> None:
 
     with pytest.raises(InvalidConfiguration):
         load_agent_skills(agent_dir)
+
+
+def test_load_agent_skills_discovers_attachments_on_first_access(tmp_path: Path) -> None:
+    agent_dir = tmp_path / "agents" / "workflow"
+    skill_dir = agent_dir / "skills" / "deep_focus"
+    _write(
+        skill_dir / "SKILL.md",
+        """---
+name: Deep Focus
+description: Stay on task
+---
+Always plan before coding.
+""",
+    )
+
+    skill = load_agent_skills(agent_dir)[0]
+    _write(skill_dir / "notes" / "later.md", "Added after loading")
+
+    assert [attachment.relative_path for attachment in skill.attachments] == ["notes/later.md"]
+
+
+def test_load_agent_skills_reads_embed_attachments_flag(tmp_path: Path) -> None:
+    agent_dir = tmp_path / "agents" / "workflow"
+    _write(
+        agent_dir / "skills" / "deep_focus" / "SKILL.md",
+        """---
+name: Deep Focus
+description: Stay on task
+embed_attachments: false
+---
+Always plan before coding.
+""",
+    )
+    _write(
+        agent_dir / "skills" / "release" / "SKILL.md",
+        """---
+name: Release
+description: Ship it
+embed_attachments: sometimes
+---
+Follow the checklist.
+""",
+    )
+
+    with pytest.raises(InvalidConfiguration, match="embed_attachments"):
+        load_agent_skills(agent_dir)
+
+    _write(
+        agent_dir / "skills" / "release" / "SKILL.md",
+        """---
+name: Release
+description: Ship it
+---
+Follow the checklist.
+""",
+    )
+    assert [skill.embed_attachments for skill in load_agent_skills(agent_dir)] == [False, True]
+
+
+def test_load_agent_skills_manifest_quoting_and_whitespace(tmp_path: Path) -> None:
+    """Keys and values are stripped of any whitespace; one pair of enclosing quotes is removed."""
+
+    agent_dir = tmp_path / "agents" / "workflow"
+    _write(
+        agent_dir / "skills" / "deep_focus" / "SKILL.md",
+        '---\n'
+        ' name　:  "Deep "Focus""  \n'
+        '  # comments are skipped\n'
+        "description: 'Plan: then code'\n"
+        '---\n'
+        'Always plan before coding.\n',
+    )
+
+    skill = load_agent_skills(agent_dir)[0]
+    assert skill.name == 'Deep "Focus"'
+    assert skill.description == "Plan: then code"
@@ -4,6 +4,8 @@ import asyncio
 import json
 from pathlib import Path
 
+import pytest
+
 from codex_sub_agent.skills import AgentSkill, AgentSkillAttachment, render_skill_section
 
 
@@ -54,3 +56,56 @@ def test_render_skill_section_lists_tools(tmp_path: Path) -> None:
     rendered = render_skill_section([skill])
     assert "Deploy" in rendered
     assert "skill_deploy" in rendered
+
+
+def test_attachment_text_is_read_once_when_small(tmp_path: Path) -> None:
+    small = tmp_path / "small.txt"
+    small.write_text("first", encoding="utf-8")
+    attachment = AgentSkillAttachment(
+        filename="small.txt", relative_path="small.txt", absolute_path=small, size_bytes=small.stat().st_size
+    )
+    assert attachment.read_text() == "first"
+    small.write_text("second", encoding="utf-8")
+    assert attachment.read_text() == "first"
+
+    large = AgentSkillAttachment(
+        filename="large.txt", relative_path="large.txt", absolute_path=small, size_bytes=10 * 1024 * 1024
+    )
+    assert large.read_text() == "second"
+    small.write_text("third", encoding="utf-8")
+    assert large.read_text() == "third"
+
+
+def test_attachment_text_uses_universal_newlines(tmp_path: Path) -> None:
+    path = tmp_path / "windows.txt"
+    path.write_bytes("café\r\nline two\rend".encode())
+    attachment = AgentSkillAttachment(
+        filename="windows.txt", relative_path="windows.txt", absolute_path=path, size_bytes=path.stat().st_size
+    )
+
+    assert attachment.read_text() == "café\nline two\nend"
+
+
+def test_unembedded_attachments_are_readable_by_relative_path(tmp_path: Path) -> None:
+    """With embedding off, the full payload points the agent at the tool's attachment argument."""
+
+    guide = tmp_path / "notes" / "guide.md"
+    guide.parent.mkdir()
+    guide.write_text("Long-form guidance.", encoding="utf-8")
+    skill = AgentSkill(
+        slug="deep_focus",
+        name="Deep Focus",
+        description="Stay on task",
+        instructions="Plan first.",
+        directory=tmp_path,
+        attachments=None,
+        embed_attachments=False,
+    )
+
+    full = json.loads(skill._render_full_payload("demo"))
+    entry = full["attachment_contents"]["notes/guide.md"]
+    assert entry["available_via"] == "attachment='notes/guide.md'"
+    assert "Long-form guidance." not in json.dumps(full)
+    assert skill.read_attachment("notes/guide.md") == "Long-form guidance."
+    with pytest.raises(ValueError, match="no attachment"):
+        skill.read_attachment("../escape.md")